@@ -0,0 +1,406 @@
+# Structured registry of the request and response shapes of every BakeSpace AI API
+# endpoint.  The OpenAPI document, the generated Python and JavaScript clients, and
+# the stub server used for contract checks are all built from OPERATIONS below, so
+# this is the one place where the shape of a request is defined.  The long form
+# descriptions are pulled from the docs pages in endpoint_registry.py.
+
+import textwrap
+
+API_TITLE = "BakeSpace AI API"
+API_VERSION = "0.1.0"
+
+
+def ref(name):
+    return {"$ref": f"#/components/schemas/{name}"}
+
+
+def array(items):
+    return {"type": "array", "items": items}
+
+
+STRING = {"type": "string"}
+INTEGER = {"type": "integer"}
+OPTIONAL_STRING = {"type": "string", "nullable": True}
+OPTIONAL_INTEGER = {"type": "integer", "nullable": True}
+OBJECT = {"type": "object"}
+
+# Every request may carry a trace id, see the Observability Endpoints page.  The
+# services use the one sent (or generate one) and return it in the response.
+TRACE_HEADER = "X-Trace-Id"
+TRACE_DESCRIPTION = "Trace id of the request, generated by the service when it is not sent"
+
+SCHEMAS = {
+    "ChatMessage": {
+        "type": "object",
+        "properties": {"role": STRING, "content": STRING},
+        "required": ["role", "content"],
+    },
+    "Recipe": {
+        "type": "object",
+        "properties": {
+            "recipe_id": OPTIONAL_STRING,
+            "name": STRING,
+            "desc": OPTIONAL_STRING,
+            "preptime": INTEGER,
+            "cooktime": INTEGER,
+            "totaltime": INTEGER,
+            "servings": INTEGER,
+            "directions": array(STRING),
+            "ingredients": array(STRING),
+            "calories": OPTIONAL_INTEGER,
+            "recipe_text": STRING,
+        },
+        "required": ["name", "preptime", "cooktime", "totaltime", "servings", "directions", "ingredients", "recipe_text"],
+    },
+    "Pairing": {
+        "type": "object",
+        "properties": {"pairing_text": STRING, "pairing_reason": STRING},
+        "required": ["pairing_text", "pairing_reason"],
+    },
+    "RecipeContext": {
+        "type": "object",
+        "properties": {"recipe_id": STRING, "token_count": INTEGER},
+        "required": ["recipe_id", "token_count"],
+    },
+}
+
+# Each operation is keyed by the same "METHOD /path" name used on its docs page.
+#   page      -- docs page in endpoint_registry.PAGES that holds the description
+#   tag       -- service the endpoint belongs to
+#   body      -- JSON body properties, with the names listed in "required" required
+#   any_of    -- groups of body properties where at least one of each group must be sent
+#   query     -- query string parameters, all required
+#   files     -- multipart form field that takes one or more uploaded files
+#   response  -- response schema, returned as JSON unless "text" is set
+#   history   -- the response is a history list that supports `since=` cursors (sequence
+#                numbers of the entries) for incremental reads and ETag / If-None-Match
+#                conditional GETs
+OPERATIONS = {
+    "POST /initialize_chat": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "Initialize a chat with some context or a registered recipe",
+        "body": {"context": STRING, "recipe_id": STRING},
+        "required": [],
+        "any_of": [["context", "recipe_id"]],
+        "response": ref("ChatMessage"),
+    },
+    "POST /add_user_message": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "Add a user message to the chat",
+        "body": {"message": STRING},
+        "required": ["message"],
+        "response": array(OBJECT),
+    },
+    "POST /add_chef_message": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "Add a chef message to the chat",
+        "body": {"message": STRING},
+        "required": ["message"],
+        "response": array(OBJECT),
+    },
+    "POST /get_chef_response": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "Get the chef's response to a user question",
+        "body": {"question": STRING, "chat_messages": array(ref("ChatMessage"))},
+        "required": ["question", "chat_messages"],
+        "response": STRING,
+    },
+    "GET /view_chat_history": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "View the chat history",
+        "response": array(ref("ChatMessage")),
+        "history": True,
+    },
+    "DELETE /clear_chat_history": {
+        "page": "Chat Endpoints",
+        "tag": "chat",
+        "summary": "Clear the chat history",
+        "response": OBJECT,
+    },
+    "POST /extract-pdf": {
+        "page": "Extracton Endpoints",
+        "tag": "extraction",
+        "summary": "Extract the text from uploaded pdf files",
+        "files": "pdfs",
+        "response": array(STRING),
+    },
+    "POST /spellcheck-text": {
+        "page": "Extracton Endpoints",
+        "tag": "extraction",
+        "summary": "Return the text with spelling corrections",
+        "body": {"text": STRING},
+        "required": ["text"],
+        "response": STRING,
+    },
+    "POST /extract-text-from-txt": {
+        "page": "Extracton Endpoints",
+        "tag": "extraction",
+        "summary": "Extract the text from uploaded .txt files",
+        "files": "text_files",
+        "response": array(STRING),
+    },
+    "POST /extract-text-from-images": {
+        "page": "Extracton Endpoints",
+        "tag": "extraction",
+        "summary": "Extract the text from uploaded images",
+        "files": "images",
+        "response": array(STRING),
+    },
+    "POST /format-recipe": {
+        "page": "Extracton Endpoints",
+        "tag": "extraction",
+        "summary": "Format raw recipe text into a Recipe",
+        "body": {"raw_text": STRING},
+        "required": ["raw_text"],
+        "response": ref("Recipe"),
+    },
+    "POST /generate_recipe": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Generate a recipe from the user's specifications",
+        "body": {"specifications": STRING},
+        "required": ["specifications"],
+        "response": ref("Recipe"),
+    },
+    "POST /register_recipe_context": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Register a recipe's prompt prefix and return its recipe_id",
+        "body": {"recipe_text": STRING},
+        "required": ["recipe_text"],
+        "response": ref("RecipeContext"),
+    },
+    "GET /get_recipe_by_name": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Get a saved recipe by name",
+        "query": {"recipe_name": STRING},
+        "response": ref("Recipe"),
+    },
+    "POST /save_recipe_by_name": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Save a recipe by name",
+        "body": {"recipe_name": STRING, "recipe": ref("Recipe")},
+        "required": ["recipe_name", "recipe"],
+        "response": OBJECT,
+    },
+    "DELETE /delete_recipe_by_name": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Delete a saved recipe by name",
+        "query": {"recipe_name": STRING},
+        "response": OBJECT,
+    },
+    "GET /view_recipe_history": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "View the current session's recipe history",
+        "response": array(ref("Recipe")),
+        "history": True,
+    },
+    "DELETE /clear_recipe_history": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Clear the current session's recipe history",
+        "response": OBJECT,
+    },
+    "POST /save_recipe_history": {
+        "page": "Recipe Endpoints",
+        "tag": "recipe",
+        "summary": "Save the current session's recipe history",
+        "response": OBJECT,
+    },
+    "POST /generate_image_url": {
+        "page": "Pairing and Image Endpoints",
+        "tag": "image",
+        "summary": "Generate an image url from a prompt or a registered recipe",
+        "body": {"prompt": STRING, "recipe_id": STRING},
+        "required": [],
+        "any_of": [["prompt", "recipe_id"]],
+        "response": STRING,
+    },
+    "POST /generate_pairing": {
+        "page": "Pairing and Image Endpoints",
+        "tag": "pairing",
+        "summary": "Generate a pairing for a recipe",
+        "body": {"pairing_type": STRING, "recipe_text": STRING, "recipe_id": STRING},
+        "required": ["pairing_type"],
+        "any_of": [["recipe_text", "recipe_id"]],
+        "response": ref("Pairing"),
+    },
+    "GET /metrics": {
+        "page": "Observability Endpoints",
+        "tag": "observability",
+        "summary": "Prometheus metrics for the service",
+        "response": STRING,
+        "text": True,
+    },
+}
+
+
+def split_key(key):
+    method, path = key.split(" ", 1)
+    return method.lower(), path
+
+
+def operation_id(key):
+    # "POST /format-recipe" -> "format_recipe"
+    return split_key(key)[1].strip("/").replace("-", "_")
+
+
+def build_operation(key, operation, description):
+    spec = {
+        "operationId": operation_id(key),
+        "summary": operation["summary"],
+        "tags": [operation["tag"]],
+        "responses": {},
+    }
+    if description:
+        spec["description"] = description
+    spec["parameters"] = []
+    if "query" in operation:
+        spec["parameters"] += [
+            {"name": name, "in": "query", "required": True, "schema": schema}
+            for name, schema in operation["query"].items()
+        ]
+    if operation.get("history"):
+        spec["parameters"] += [
+            {
+                "name": "since",
+                "in": "query",
+                "required": False,
+                "description": "Sequence number of the last entry already read, from X-History-Cursor; only "
+                "the entries appended after it are returned",
+                "schema": {"type": "integer", "minimum": 0},
+            },
+            {"name": "If-None-Match", "in": "header", "required": False, "schema": STRING},
+        ]
+    spec["parameters"].append(
+        {"name": TRACE_HEADER, "in": "header", "required": False, "description": TRACE_DESCRIPTION, "schema": STRING}
+    )
+    if "body" in operation:
+        schema = {"type": "object", "properties": operation["body"], "additionalProperties": False}
+        # OpenAPI 3.0 does not allow an empty required list
+        if operation["required"]:
+            schema["required"] = operation["required"]
+        groups = operation.get("any_of", [])
+        if len(groups) == 1:
+            schema["anyOf"] = [{"required": [name]} for name in groups[0]]
+        elif groups:
+            schema["allOf"] = [{"anyOf": [{"required": [name]} for name in group]} for group in groups]
+        spec["requestBody"] = {"required": True, "content": {"application/json": {"schema": schema}}}
+    if "files" in operation:
+        spec["requestBody"] = {
+            "required": True,
+            "content": {"multipart/form-data": {"schema": {
+                "type": "object",
+                "properties": {operation["files"]: array({"type": "string", "format": "binary"})},
+                "required": [operation["files"]],
+            }}},
+        }
+    media_type = "text/plain" if operation.get("text") else "application/json"
+    trace_header = {TRACE_HEADER: {"description": TRACE_DESCRIPTION, "schema": STRING}}
+    spec["responses"]["200"] = {
+        "description": "Successful response",
+        "headers": dict(trace_header),
+        "content": {media_type: {"schema": operation["response"]}},
+    }
+    if operation.get("history"):
+        spec["responses"]["200"]["headers"].update({
+            "ETag": {"description": "Version of the returned entries", "schema": STRING},
+            "X-History-Cursor": {
+                "description": "Sequence number of the last entry, the value of `since` to pass on the next poll",
+                "schema": INTEGER,
+            },
+        })
+        spec["responses"]["304"] = {
+            "description": "Nothing has changed since the ETag sent in If-None-Match",
+            "headers": dict(trace_header),
+        }
+    return spec
+
+
+def build_openapi(descriptions=None):
+    # descriptions maps page -> endpoint name -> {"description": ...}.  By default they
+    # are read from the docs registry, which needs streamlit to be importable.
+    if descriptions is None:
+        from endpoint_registry import PAGES
+        descriptions = PAGES
+    paths = {}
+    for key, operation in OPERATIONS.items():
+        method, path = split_key(key)
+        entry = descriptions.get(operation["page"], {}).get(key, {})
+        description = textwrap.dedent(entry.get("description", "")).strip()
+        paths.setdefault(path, {})[method] = build_operation(key, operation, description)
+    return {
+        "openapi": "3.0.3",
+        "info": {"title": API_TITLE, "version": API_VERSION},
+        "servers": [{"url": "http://localhost:8000"}],
+        "paths": paths,
+        "components": {"schemas": SCHEMAS},
+    }
+
+
+def resolve(schema, spec):
+    while "$ref" in schema:
+        schema = spec["components"]["schemas"][schema["$ref"].rsplit("/", 1)[-1]]
+    return schema
+
+
+def validate(value, schema, spec, path="$"):
+    # Checks a decoded JSON value against the subset of OpenAPI schemas used above and
+    # returns a list of error messages, empty if the value matches
+    schema = resolve(schema, spec)
+    if value is None:
+        return [] if schema.get("nullable") else [f"{path}: must not be null"]
+    kind = schema.get("type")
+    if kind == "object":
+        if not isinstance(value, dict):
+            return [f"{path}: expected an object"]
+        errors = [f"{path}: missing required field '{name}'" for name in schema.get("required", []) if name not in value]
+        for any_of in [schema["anyOf"]] if "anyOf" in schema else [item["anyOf"] for item in schema.get("allOf", [])]:
+            names = [name for option in any_of for name in option["required"]]
+            if not any(name in value for name in names):
+                errors.append(f"{path}: one of {', '.join(repr(name) for name in names)} is required")
+        properties = schema.get("properties", {})
+        for name, item in value.items():
+            if name in properties:
+                errors.extend(validate(item, properties[name], spec, f"{path}.{name}"))
+            elif schema.get("additionalProperties") is False:
+                errors.append(f"{path}: unexpected field '{name}'")
+        return errors
+    if kind == "array":
+        if not isinstance(value, list):
+            return [f"{path}: expected an array"]
+        errors = []
+        for i, item in enumerate(value):
+            errors.extend(validate(item, schema["items"], spec, f"{path}[{i}]"))
+        return errors
+    if kind == "string" and not isinstance(value, str):
+        return [f"{path}: expected a string"]
+    if kind == "integer" and (not isinstance(value, int) or isinstance(value, bool)):
+        return [f"{path}: expected an integer"]
+    if "minimum" in schema and value < schema["minimum"]:
+        return [f"{path}: must be at least {schema['minimum']}"]
+    return []
+
+
+def example(schema, spec, name="value"):
+    # Builds a value that matches the schema, used for stub responses and contract check requests
+    schema = resolve(schema, spec)
+    kind = schema.get("type")
+    if kind == "object":
+        return {field: example(item, spec, field) for field, item in schema.get("properties", {}).items()}
+    if kind == "array":
+        return [example(schema["items"], spec, name)]
+    if kind == "integer":
+        return 1
+    if schema.get("format") == "binary":
+        return b"example"
+    return f"example {name}"
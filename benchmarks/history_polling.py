@@ -0,0 +1,158 @@
+# Measures the bytes transferred by a typical polling session against the history
+# endpoints of the stub server, with and without response compression, ETag
+# conditional GETs, and `since=` cursors.
+#
+# The session polls /view_chat_history and /view_recipe_history every couple of
+# seconds while the user chats (a question and answer every 10 polls, and every other
+# time a retry on the next poll that repeats the exchange word for word) and saves a
+# new recipe every 40 polls.  Like the backend, the chat history is capped, so older messages
+# are trimmed.
+#
+# Usage: python benchmarks/history_polling.py [--polls 120]
+
+import argparse
+import gzip
+import http.client
+import json
+import os
+import sys
+import threading
+from urllib.parse import urlencode
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from stub_server import History, make_server  # noqa: E402
+
+# Smaller than the backend's default max_history of 50 so the session trims the history
+MAX_HISTORY = 20
+
+STRATEGIES = {
+    "full history": {"compress": False, "etag": False, "since": False},
+    "gzip": {"compress": True, "etag": False, "since": False},
+    "gzip + ETag": {"compress": True, "etag": True, "since": False},
+    "gzip + ETag + since": {"compress": True, "etag": True, "since": True},
+}
+
+
+def make_recipe(i):
+    ingredients = [f"{j + 1} cup ingredient {j} for recipe {i}" for j in range(12)]
+    directions = [f"Step {j + 1}: combine the ingredients and cook for {5 * (j + 1)} minutes." for j in range(10)]
+    recipe_text = f"Recipe {i}\n\nIngredients:\n" + "\n".join(ingredients) + "\n\nDirections:\n" + "\n".join(directions)
+    return {
+        "recipe_id": f"{i:016x}",
+        "name": f"Recipe {i}",
+        "desc": "A hearty weeknight dinner that comes together in under an hour.",
+        "preptime": 15,
+        "cooktime": 40,
+        "totaltime": 55,
+        "servings": 4,
+        "directions": directions,
+        "ingredients": ingredients,
+        "calories": 520,
+        "recipe_text": recipe_text,
+    }
+
+
+def make_message(role, i):
+    content = f"Message {i}: " + "Let the dough rest for at least an hour before shaping it into loaves. " * 3
+    return {"role": role, "content": content}
+
+
+def make_exchange(i):
+    return [{"role": "user", "content": f"How long should dough {i} rest?"}, make_message("ai", i + 1)]
+
+
+class Poller:
+    def __init__(self, port, strategy):
+        self.connection = http.client.HTTPConnection("127.0.0.1", port)
+        self.strategy = strategy
+        self.etags = {}
+        self.cursors = {}
+        self.entries = {}
+        self.bytes = 0
+
+    def poll(self, path):
+        headers = {"Accept-Encoding": "gzip" if self.strategy["compress"] else "identity"}
+        if self.strategy["etag"] and path in self.etags:
+            headers["If-None-Match"] = self.etags[path]
+        query = {"since": self.cursors.get(path, 0)} if self.strategy["since"] else {}
+        self.connection.request("GET", path + ("?" + urlencode(query) if query else ""), headers=headers)
+        response = self.connection.getresponse()
+        body = response.read()
+        # Status line and headers as they were sent on the wire, plus the (possibly compressed) body
+        self.bytes += len(f"HTTP/1.1 {response.status} {response.reason}\r\n") + 2
+        self.bytes += sum(len(f"{name}: {value}\r\n") for name, value in response.getheaders())
+        self.bytes += len(body)
+        if response.status == 304:
+            return
+        if self.strategy["etag"]:
+            self.etags[path] = response.getheader("ETag")
+        data = body
+        if response.getheader("Content-Encoding") == "gzip":
+            data = gzip.decompress(body)
+        entries = json.loads(data)
+        if self.strategy["since"]:
+            self.entries.setdefault(path, []).extend(entries)
+            self.cursors[path] = int(response.getheader("X-History-Cursor"))
+        else:
+            self.entries[path] = entries
+
+
+def run_session(strategy, polls):
+    appended = {
+        "/view_chat_history": [make_message("user" if i % 2 == 0 else "ai", i) for i in range(10)],
+        "/view_recipe_history": [make_recipe(i) for i in range(2)],
+    }
+    histories = {
+        "/view_chat_history": History(appended["/view_chat_history"], max_length=MAX_HISTORY),
+        "/view_recipe_history": History(appended["/view_recipe_history"]),
+    }
+    server = make_server(port=0, histories=histories)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    poller = Poller(server.server_address[1], strategy)
+    try:
+        for poll in range(polls):
+            chat = appended["/view_chat_history"]
+            if poll and poll % 10 == 0:
+                exchange = make_exchange(len(chat))
+            elif poll % 20 == 11:
+                # The retry repeats the exchange that was just polled, which must still be
+                # delivered as new messages
+                exchange = chat[-2:]
+            else:
+                exchange = []
+            chat += exchange
+            histories["/view_chat_history"].extend(exchange)
+            if poll and poll % 40 == 0:
+                recipe = make_recipe(len(appended["/view_recipe_history"]))
+                appended["/view_recipe_history"].append(recipe)
+                histories["/view_recipe_history"].append(recipe)
+            for path in histories:
+                poller.poll(path)
+        # Polling with a cursor has to receive every entry exactly once, including the
+        # trimmed and repeated ones, and without one has to see the retained entries
+        for path, history in histories.items():
+            expected = appended[path] if strategy["since"] else history.read()[0]
+            assert poller.entries[path] == expected, f"{path} does not match with {strategy}"
+    finally:
+        poller.connection.close()
+        server.shutdown()
+    return poller.bytes
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure bytes transferred while polling the history endpoints")
+    parser.add_argument("--polls", type=int, default=120, help="number of times each history endpoint is polled")
+    args = parser.parse_args()
+
+    baseline = None
+    print(f"{'strategy':<24}{'bytes':>12}{'vs full':>10}")
+    for name, strategy in STRATEGIES.items():
+        transferred = run_session(strategy, args.polls)
+        baseline = baseline or transferred
+        print(f"{name:<24}{transferred:>12,}{transferred / baseline:>10.1%}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,96 @@
+# Measures how long a rerun of each documentation page takes, both for the initial
+# load and for every change of the selected endpoint in the selectbox.  Uses
+# Streamlit's AppTest so no browser or running server is needed.
+#
+# Pass --baseline with a git revision to also measure the pages as they were at that
+# revision and print the two side by side.  Without a revision it compares against
+# the pages from the revision before endpoint_registry.py was added.
+#
+# Usage: python benchmarks/rerun_latency.py [--runs 20] [--baseline [REVISION]]
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from endpoint_registry import PAGES  # noqa: E402
+
+
+def time_run(app):
+    start = time.perf_counter()
+    app.run()
+    return time.perf_counter() - start
+
+
+def measure_page(path, runs):
+    app = AppTest.from_file(path, default_timeout=30)
+    first_run = time_run(app)
+    rerun_times = []
+    for _ in range(runs):
+        for option in app.selectbox[0].options:
+            app.selectbox[0].select(option)
+            rerun_times.append(time_run(app))
+    return first_run, statistics.median(rerun_times), statistics.quantiles(rerun_times, n=20)[-1]
+
+
+def registry_baseline():
+    # The revision before the one that added endpoint_registry.py
+    added = subprocess.run(
+        ["git", "log", "--diff-filter=A", "--format=%H", "--", "endpoint_registry.py"],
+        cwd=ROOT, check=True, capture_output=True, text=True,
+    ).stdout.split()
+    if not added:
+        raise SystemExit("endpoint_registry.py is not in the git history, pass --baseline a revision")
+    # git log lists the newest first, so take the oldest in case the file was ever re-added
+    return f"{added[-1]}~1"
+
+
+def checkout_pages(revision, directory):
+    # Writes the pages as they were at the revision into directory and returns their paths
+    paths = {}
+    for page in PAGES:
+        try:
+            source = subprocess.run(
+                ["git", "show", f"{revision}:pages/{page}.py"], cwd=ROOT, check=True, capture_output=True
+            ).stdout
+        except subprocess.CalledProcessError:
+            continue
+        paths[page] = os.path.join(directory, f"{page}.py")
+        with open(paths[page], "wb") as f:
+            f.write(source)
+    return paths
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure rerun latency of the documentation pages")
+    parser.add_argument("--runs", type=int, default=20, help="number of passes through every endpoint of each page")
+    parser.add_argument(
+        "--baseline", nargs="?", const="", metavar="REVISION",
+        help="git revision of the pages to compare against, by default the one before endpoint_registry.py was added",
+    )
+    args = parser.parse_args()
+    if args.baseline == "":
+        args.baseline = registry_baseline()
+
+    current = {page: os.path.join(ROOT, "pages", f"{page}.py") for page in PAGES}
+    with tempfile.TemporaryDirectory() as directory:
+        baseline = checkout_pages(args.baseline, directory) if args.baseline is not None else {}
+        print(f"{'page':<30}{'version':<10}{'first run':>12}{'median':>12}{'p95':>12}")
+        for page, path in current.items():
+            versions = [("baseline", baseline[page])] if page in baseline else []
+            versions.append(("current", path))
+            for version, version_path in versions:
+                first_run, median, p95 = measure_page(version_path, args.runs)
+                print(f"{page:<30}{version:<10}{first_run * 1000:>10.1f}ms{median * 1000:>10.1f}ms{p95 * 1000:>10.1f}ms")
+
+
+if __name__ == "__main__":
+    main()
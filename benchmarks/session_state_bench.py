@@ -0,0 +1,89 @@
+# Compares the memory and rerun serialization cost of a 100-turn chat session kept
+# as plain dicts (the way the Chat Streamlit example holds it, appending each
+# message to one list in place) with the same session kept in the slotted types
+# from clients/bakespace_models.py.
+#
+# For each representation it reports the memory held by the session, the pickled
+# size, the time to pickle and unpickle it once (the cost Streamlit pays on every
+# rerun with serializable session state), and the total time spent appending the
+# 200 messages.
+#
+# Usage: python benchmarks/session_state_bench.py [--turns 100]
+
+import argparse
+import os
+import pickle
+import sys
+import timeit
+import tracemalloc
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, "clients"))
+
+from bakespace_models import ChatHistory, ChatMessage, Recipe  # noqa: E402
+
+
+def make_message(role, i):
+    return {"role": role, "content": f"Message {i}: let the dough rest for at least an hour before shaping it."}
+
+
+def make_recipe():
+    ingredients = [f"{j + 1} cup ingredient {j}" for j in range(12)]
+    directions = [f"Step {j + 1}: combine and cook for {5 * (j + 1)} minutes." for j in range(10)]
+    return {
+        "recipe_id": "0123456789abcdef",
+        "name": "Weeknight Bread",
+        "desc": "A simple loaf.",
+        "preptime": 15,
+        "cooktime": 40,
+        "totaltime": 55,
+        "servings": 4,
+        "directions": directions,
+        "ingredients": ingredients,
+        "calories": 520,
+        "recipe_text": "\n".join(ingredients + directions),
+    }
+
+
+def dict_session(messages, recipe):
+    # Like chat_service.chat_history.append(...) in the Chat Streamlit example
+    state = {"chat_history": [], "recipe": dict(recipe)}
+    for message in messages:
+        state["chat_history"].append(dict(message))
+    return state
+
+
+def slotted_session(messages, recipe):
+    state = {"chat_history": ChatHistory(), "recipe": Recipe.from_dict(recipe)}
+    for message in messages:
+        state["chat_history"] = state["chat_history"].append(ChatMessage.from_dict(message))
+    return state
+
+
+def measure(build, messages, recipe, repeat):
+    tracemalloc.start()
+    state = build(messages, recipe)
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    data = pickle.dumps(state)
+    build_time = min(timeit.repeat(lambda: build(messages, recipe), number=1, repeat=repeat))
+    rerun_time = min(timeit.repeat(lambda: pickle.loads(pickle.dumps(state)), number=1, repeat=repeat))
+    return memory, len(data), rerun_time, build_time
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Measure session state memory and serialization cost")
+    parser.add_argument("--turns", type=int, default=100, help="number of question and answer turns in the chat")
+    parser.add_argument("--repeat", type=int, default=50, help="number of timing repeats, the fastest is reported")
+    args = parser.parse_args()
+
+    messages = [make_message("user" if i % 2 == 0 else "ai", i) for i in range(2 * args.turns)]
+    recipe = make_recipe()
+    print(f"{'session state':<16}{'memory':>12}{'pickled':>12}{'pickle+load':>14}{'all appends':>14}")
+    for name, build in [("dicts", dict_session), ("slotted", slotted_session)]:
+        memory, pickled, rerun_time, build_time = measure(build, messages, recipe, args.repeat)
+        print(f"{name:<16}{memory:>10,} B{pickled:>10,} B{rerun_time * 1e6:>12.0f}us{build_time * 1e6:>12.0f}us")
+
+
+if __name__ == "__main__":
+    main()
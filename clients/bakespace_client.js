@@ -0,0 +1,310 @@
+// Generated by generate_api.py from api_spec.py -- do not edit by hand.
+//
+// Typed client for the BakeSpace AI API.  Browsers and Node already reuse
+// connections to the backend between fetch calls; in Node an undici Agent can be
+// passed as `dispatcher` to control the size of the connection pool.  Every request
+// sends an X-Trace-Id: pass traceId to propagate the id of the trace the calls
+// belong to, otherwise a new one is generated for each request.
+
+/**
+ * @typedef {Object} ChatMessage
+ * @property {string} role
+ * @property {string} content
+ */
+
+/**
+ * @typedef {Object} Recipe
+ * @property {?string} [recipe_id]
+ * @property {string} name
+ * @property {?string} [desc]
+ * @property {number} preptime
+ * @property {number} cooktime
+ * @property {number} totaltime
+ * @property {number} servings
+ * @property {string[]} directions
+ * @property {string[]} ingredients
+ * @property {?number} [calories]
+ * @property {string} recipe_text
+ */
+
+/**
+ * @typedef {Object} Pairing
+ * @property {string} pairing_text
+ * @property {string} pairing_reason
+ */
+
+/**
+ * @typedef {Object} RecipeContext
+ * @property {string} recipe_id
+ * @property {number} token_count
+ */
+
+export class BakespaceClient {
+  constructor({ baseUrl = 'http://localhost:8000', fetchImpl = fetch, dispatcher, traceId } = {}) {
+    this.baseUrl = baseUrl.replace(/\/$/, '');
+    // Browsers throw "Illegal invocation" when fetch is called as a method of another object
+    this.fetch = fetchImpl.bind(globalThis);
+    this.dispatcher = dispatcher;
+    this.traceId = traceId;
+    // Trace id the service returned for the last request, to look it up in the exported traces
+    this.lastTraceId = undefined;
+    // path -> { etag, data } of the last response from each history endpoint.  Keyed by the path
+    // alone so it does not grow as the cursor moves; the ETag covers the cursor, so an ETag
+    // sent for a different `since` is simply answered with a 200.
+    this.etagCache = new Map();
+    // path -> X-History-Cursor of the last response, the `since` to pass on the next poll
+    this.cursors = new Map();
+  }
+
+  async _request(method, path, { json, query, files, text = false, conditional = false, traceId } = {}) {
+    traceId = traceId || this.traceId || crypto.randomUUID().replaceAll('-', '');
+    const init = { method, headers: { 'X-Trace-Id': traceId } };
+    if (query) query = Object.fromEntries(Object.entries(query).filter(([, value]) => value !== undefined && value !== null));
+    if (this.dispatcher) init.dispatcher = this.dispatcher;
+    if (json !== undefined) {
+      // Leave out optional fields that were not passed so the request stays compact
+      const body = Object.fromEntries(Object.entries(json).filter(([, value]) => value !== undefined && value !== null));
+      init.headers['Content-Type'] = 'application/json';
+      init.body = JSON.stringify(body);
+    }
+    if (files !== undefined) {
+      const form = new FormData();
+      for (const [field, fileList] of Object.entries(files)) {
+        for (const file of fileList) form.append(field, file);
+      }
+      init.body = form;
+    }
+    const search = query ? new URLSearchParams(query).toString() : '';
+    const url = this.baseUrl + path + (search ? `?${search}` : '');
+    const cached = conditional ? this.etagCache.get(path) : undefined;
+    if (cached) init.headers['If-None-Match'] = cached.etag;
+    const response = await this.fetch(url, init);
+    this.lastTraceId = response.headers.get('X-Trace-Id') || traceId;
+    const cursor = response.headers.get('X-History-Cursor');
+    if (conditional && cursor !== null) this.cursors.set(path, Number(cursor));
+    if (cached && response.status === 304) return cached.data;
+    if (!response.ok) throw new Error(`${method} ${path} failed with status ${response.status}`);
+    const data = await (text ? response.text() : response.json());
+    const etag = response.headers.get('ETag');
+    if (conditional && etag) this.etagCache.set(path, { etag, data });
+    return data;
+  }
+
+  /**
+   * Initialize a chat with some context or a registered recipe.
+   * @param {Object} args
+   * @param {string} [args.context]
+   * @param {string} [args.recipe_id]
+   * @returns {Promise<ChatMessage>}
+   */
+  initializeChat({ context, recipe_id } = {}) {
+    return this._request('POST', '/initialize_chat', { json: { context, recipe_id } });
+  }
+
+  /**
+   * Add a user message to the chat.
+   * @param {Object} args
+   * @param {string} args.message
+   * @returns {Promise<Object[]>}
+   */
+  addUserMessage({ message } = {}) {
+    return this._request('POST', '/add_user_message', { json: { message } });
+  }
+
+  /**
+   * Add a chef message to the chat.
+   * @param {Object} args
+   * @param {string} args.message
+   * @returns {Promise<Object[]>}
+   */
+  addChefMessage({ message } = {}) {
+    return this._request('POST', '/add_chef_message', { json: { message } });
+  }
+
+  /**
+   * Get the chef's response to a user question.
+   * @param {Object} args
+   * @param {string} args.question
+   * @param {ChatMessage[]} args.chat_messages
+   * @returns {Promise<string>}
+   */
+  getChefResponse({ question, chat_messages } = {}) {
+    return this._request('POST', '/get_chef_response', { json: { question, chat_messages } });
+  }
+
+  /**
+   * View the chat history.
+   * @param {Object} args
+   * @param {number} [args.since] sequence number of the last entry already read, kept in `cursors`, to only fetch the new ones
+   * @returns {Promise<ChatMessage[]>}
+   */
+  viewChatHistory({ since } = {}) {
+    return this._request('GET', '/view_chat_history', { query: { since }, conditional: true });
+  }
+
+  /**
+   * Clear the chat history.
+   * @returns {Promise<Object>}
+   */
+  clearChatHistory() {
+    return this._request('DELETE', '/clear_chat_history');
+  }
+
+  /**
+   * Extract the text from uploaded pdf files.
+   * @param {Object} args
+   * @param {Blob[]} args.files
+   * @returns {Promise<string[]>}
+   */
+  extractPdf({ files } = {}) {
+    return this._request('POST', '/extract-pdf', { files: { pdfs: files } });
+  }
+
+  /**
+   * Return the text with spelling corrections.
+   * @param {Object} args
+   * @param {string} args.text
+   * @returns {Promise<string>}
+   */
+  spellcheckText({ text } = {}) {
+    return this._request('POST', '/spellcheck-text', { json: { text } });
+  }
+
+  /**
+   * Extract the text from uploaded .txt files.
+   * @param {Object} args
+   * @param {Blob[]} args.files
+   * @returns {Promise<string[]>}
+   */
+  extractTextFromTxt({ files } = {}) {
+    return this._request('POST', '/extract-text-from-txt', { files: { text_files: files } });
+  }
+
+  /**
+   * Extract the text from uploaded images.
+   * @param {Object} args
+   * @param {Blob[]} args.files
+   * @returns {Promise<string[]>}
+   */
+  extractTextFromImages({ files } = {}) {
+    return this._request('POST', '/extract-text-from-images', { files: { images: files } });
+  }
+
+  /**
+   * Format raw recipe text into a Recipe.
+   * @param {Object} args
+   * @param {string} args.raw_text
+   * @returns {Promise<Recipe>}
+   */
+  formatRecipe({ raw_text } = {}) {
+    return this._request('POST', '/format-recipe', { json: { raw_text } });
+  }
+
+  /**
+   * Generate a recipe from the user's specifications.
+   * @param {Object} args
+   * @param {string} args.specifications
+   * @returns {Promise<Recipe>}
+   */
+  generateRecipe({ specifications } = {}) {
+    return this._request('POST', '/generate_recipe', { json: { specifications } });
+  }
+
+  /**
+   * Register a recipe's prompt prefix and return its recipe_id.
+   * @param {Object} args
+   * @param {string} args.recipe_text
+   * @returns {Promise<RecipeContext>}
+   */
+  registerRecipeContext({ recipe_text } = {}) {
+    return this._request('POST', '/register_recipe_context', { json: { recipe_text } });
+  }
+
+  /**
+   * Get a saved recipe by name.
+   * @param {Object} args
+   * @param {string} args.recipe_name
+   * @returns {Promise<Recipe>}
+   */
+  getRecipeByName({ recipe_name } = {}) {
+    return this._request('GET', '/get_recipe_by_name', { query: { recipe_name } });
+  }
+
+  /**
+   * Save a recipe by name.
+   * @param {Object} args
+   * @param {string} args.recipe_name
+   * @param {Recipe} args.recipe
+   * @returns {Promise<Object>}
+   */
+  saveRecipeByName({ recipe_name, recipe } = {}) {
+    return this._request('POST', '/save_recipe_by_name', { json: { recipe_name, recipe } });
+  }
+
+  /**
+   * Delete a saved recipe by name.
+   * @param {Object} args
+   * @param {string} args.recipe_name
+   * @returns {Promise<Object>}
+   */
+  deleteRecipeByName({ recipe_name } = {}) {
+    return this._request('DELETE', '/delete_recipe_by_name', { query: { recipe_name } });
+  }
+
+  /**
+   * View the current session's recipe history.
+   * @param {Object} args
+   * @param {number} [args.since] sequence number of the last entry already read, kept in `cursors`, to only fetch the new ones
+   * @returns {Promise<Recipe[]>}
+   */
+  viewRecipeHistory({ since } = {}) {
+    return this._request('GET', '/view_recipe_history', { query: { since }, conditional: true });
+  }
+
+  /**
+   * Clear the current session's recipe history.
+   * @returns {Promise<Object>}
+   */
+  clearRecipeHistory() {
+    return this._request('DELETE', '/clear_recipe_history');
+  }
+
+  /**
+   * Save the current session's recipe history.
+   * @returns {Promise<Object>}
+   */
+  saveRecipeHistory() {
+    return this._request('POST', '/save_recipe_history');
+  }
+
+  /**
+   * Generate an image url from a prompt or a registered recipe.
+   * @param {Object} args
+   * @param {string} [args.prompt]
+   * @param {string} [args.recipe_id]
+   * @returns {Promise<string>}
+   */
+  generateImageUrl({ prompt, recipe_id } = {}) {
+    return this._request('POST', '/generate_image_url', { json: { prompt, recipe_id } });
+  }
+
+  /**
+   * Generate a pairing for a recipe.
+   * @param {Object} args
+   * @param {string} args.pairing_type
+   * @param {string} [args.recipe_text]
+   * @param {string} [args.recipe_id]
+   * @returns {Promise<Pairing>}
+   */
+  generatePairing({ pairing_type, recipe_text, recipe_id } = {}) {
+    return this._request('POST', '/generate_pairing', { json: { pairing_type, recipe_text, recipe_id } });
+  }
+
+  /**
+   * Prometheus metrics for the service.
+   * @returns {Promise<string>}
+   */
+  metrics() {
+    return this._request('GET', '/metrics', { text: true });
+  }
+}
@@ -0,0 +1,186 @@
+# Generated by generate_api.py from api_spec.py -- do not edit by hand.
+#
+# Typed client for the BakeSpace AI API.  All requests go through one pooled
+# requests.Session, and JSON bodies only include the fields that were passed.
+# Every request sends an X-Trace-Id: pass trace_id to propagate the id of the
+# trace the calls belong to, otherwise a new one is generated for each request.
+
+import uuid
+from typing import Any, Dict, List, Optional, Tuple, TypedDict
+
+import requests
+from requests.adapters import HTTPAdapter
+
+
+class ChatMessage(TypedDict):
+    role: str
+    content: str
+
+
+class Recipe(TypedDict):
+    recipe_id: Optional[str]
+    name: str
+    desc: Optional[str]
+    preptime: int
+    cooktime: int
+    totaltime: int
+    servings: int
+    directions: List[str]
+    ingredients: List[str]
+    calories: Optional[int]
+    recipe_text: str
+
+
+class Pairing(TypedDict):
+    pairing_text: str
+    pairing_reason: str
+
+
+class RecipeContext(TypedDict):
+    recipe_id: str
+    token_count: int
+
+
+class BakespaceClient:
+    def __init__(self, base_url="http://localhost:8000", pool_maxsize=10, timeout=60, session=None, trace_id=None):
+        self.base_url = base_url.rstrip("/")
+        self.timeout = timeout
+        self.trace_id = trace_id
+        # Trace id the service returned for the last request, to look it up in the exported traces
+        self.last_trace_id = None
+        self.session = session or requests.Session()
+        # Keep connections to the backend open between calls instead of reconnecting every time
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
+        # path -> (ETag, data) of the last response from each history endpoint.  Keyed by the path
+        # alone so it does not grow as the cursor moves; the ETag covers the cursor, so an ETag
+        # sent for a different `since` is simply answered with a 200.
+        self.etag_cache = {}
+        # path -> X-History-Cursor of the last response, the `since` to pass on the next poll
+        self.cursors = {}
+
+    def close(self):
+        self.session.close()
+
+    def _request(self, method, path, json=None, params=None, files=None, text=False, conditional=False, trace_id=None):
+        # Leave out optional fields that were not passed so the request stays compact
+        if json is not None:
+            json = {name: value for name, value in json.items() if value is not None}
+        if params is not None:
+            params = {name: value for name, value in params.items() if value is not None}
+        headers = {"X-Trace-Id": trace_id or self.trace_id or uuid.uuid4().hex}
+        cached = self.etag_cache.get(path) if conditional else None
+        if cached is not None:
+            headers["If-None-Match"] = cached[0]
+        response = self.session.request(
+            method, self.base_url + path, json=json, params=params, files=files, headers=headers, timeout=self.timeout
+        )
+        self.last_trace_id = response.headers.get("X-Trace-Id", headers["X-Trace-Id"])
+        if conditional and "X-History-Cursor" in response.headers:
+            self.cursors[path] = int(response.headers["X-History-Cursor"])
+        if cached is not None and response.status_code == 304:
+            return cached[1]
+        response.raise_for_status()
+        data = response.text if text else response.json()
+        if conditional and "ETag" in response.headers:
+            self.etag_cache[path] = (response.headers["ETag"], data)
+        return data
+
+    def initialize_chat(self, context: Optional[str] = None, recipe_id: Optional[str] = None) -> ChatMessage:
+        """Initialize a chat with some context or a registered recipe."""
+        return self._request("POST", "/initialize_chat", json={"context": context, "recipe_id": recipe_id})
+
+    def add_user_message(self, message: str) -> List[Dict[str, Any]]:
+        """Add a user message to the chat."""
+        return self._request("POST", "/add_user_message", json={"message": message})
+
+    def add_chef_message(self, message: str) -> List[Dict[str, Any]]:
+        """Add a chef message to the chat."""
+        return self._request("POST", "/add_chef_message", json={"message": message})
+
+    def get_chef_response(self, question: str, chat_messages: List[ChatMessage]) -> str:
+        """Get the chef's response to a user question."""
+        return self._request("POST", "/get_chef_response", json={"question": question, "chat_messages": chat_messages})
+
+    def view_chat_history(self, since: Optional[int] = None) -> List[ChatMessage]:
+        """View the chat history.
+
+        Pass the sequence number of the last entry already read as `since` to only fetch the new
+        ones; it is kept in `cursors[path]` after every call.  Repeat polls send the last ETag
+        and reuse the cached entries when the server answers 304.
+        """
+        return self._request("GET", "/view_chat_history", params={"since": since}, conditional=True)
+
+    def clear_chat_history(self) -> Dict[str, Any]:
+        """Clear the chat history."""
+        return self._request("DELETE", "/clear_chat_history")
+
+    def extract_pdf(self, files: List[Tuple[str, bytes]]) -> List[str]:
+        """Extract the text from uploaded pdf files."""
+        return self._request("POST", "/extract-pdf", files=[("pdfs", file) for file in files])
+
+    def spellcheck_text(self, text: str) -> str:
+        """Return the text with spelling corrections."""
+        return self._request("POST", "/spellcheck-text", json={"text": text})
+
+    def extract_text_from_txt(self, files: List[Tuple[str, bytes]]) -> List[str]:
+        """Extract the text from uploaded .txt files."""
+        return self._request("POST", "/extract-text-from-txt", files=[("text_files", file) for file in files])
+
+    def extract_text_from_images(self, files: List[Tuple[str, bytes]]) -> List[str]:
+        """Extract the text from uploaded images."""
+        return self._request("POST", "/extract-text-from-images", files=[("images", file) for file in files])
+
+    def format_recipe(self, raw_text: str) -> Recipe:
+        """Format raw recipe text into a Recipe."""
+        return self._request("POST", "/format-recipe", json={"raw_text": raw_text})
+
+    def generate_recipe(self, specifications: str) -> Recipe:
+        """Generate a recipe from the user's specifications."""
+        return self._request("POST", "/generate_recipe", json={"specifications": specifications})
+
+    def register_recipe_context(self, recipe_text: str) -> RecipeContext:
+        """Register a recipe's prompt prefix and return its recipe_id."""
+        return self._request("POST", "/register_recipe_context", json={"recipe_text": recipe_text})
+
+    def get_recipe_by_name(self, recipe_name: str) -> Recipe:
+        """Get a saved recipe by name."""
+        return self._request("GET", "/get_recipe_by_name", params={"recipe_name": recipe_name})
+
+    def save_recipe_by_name(self, recipe_name: str, recipe: Recipe) -> Dict[str, Any]:
+        """Save a recipe by name."""
+        return self._request("POST", "/save_recipe_by_name", json={"recipe_name": recipe_name, "recipe": recipe})
+
+    def delete_recipe_by_name(self, recipe_name: str) -> Dict[str, Any]:
+        """Delete a saved recipe by name."""
+        return self._request("DELETE", "/delete_recipe_by_name", params={"recipe_name": recipe_name})
+
+    def view_recipe_history(self, since: Optional[int] = None) -> List[Recipe]:
+        """View the current session's recipe history.
+
+        Pass the sequence number of the last entry already read as `since` to only fetch the new
+        ones; it is kept in `cursors[path]` after every call.  Repeat polls send the last ETag
+        and reuse the cached entries when the server answers 304.
+        """
+        return self._request("GET", "/view_recipe_history", params={"since": since}, conditional=True)
+
+    def clear_recipe_history(self) -> Dict[str, Any]:
+        """Clear the current session's recipe history."""
+        return self._request("DELETE", "/clear_recipe_history")
+
+    def save_recipe_history(self) -> Dict[str, Any]:
+        """Save the current session's recipe history."""
+        return self._request("POST", "/save_recipe_history")
+
+    def generate_image_url(self, prompt: Optional[str] = None, recipe_id: Optional[str] = None) -> str:
+        """Generate an image url from a prompt or a registered recipe."""
+        return self._request("POST", "/generate_image_url", json={"prompt": prompt, "recipe_id": recipe_id})
+
+    def generate_pairing(self, pairing_type: str, recipe_text: Optional[str] = None, recipe_id: Optional[str] = None) -> Pairing:
+        """Generate a pairing for a recipe."""
+        return self._request("POST", "/generate_pairing", json={"pairing_type": pairing_type, "recipe_text": recipe_text, "recipe_id": recipe_id})
+
+    def metrics(self) -> str:
+        """Prometheus metrics for the service."""
+        return self._request("GET", "/metrics", text=True)
@@ -0,0 +1,169 @@
+# Compact, immutable types for holding chat and recipe state on the client, i.e. in
+# st.session_state.  Streamlit copies and (with serializable session state) pickles
+# the session state on every rerun, so these are NamedTuples: they have no per
+# instance __dict__, cannot be changed once created, and pickle as plain tuples.
+# They use much less memory than dicts, but that is all they save: they are slower
+# to pickle and much slower to append to than a list of dicts appended to in place,
+# at 100 turns and beyond; see benchmarks/session_state_bench.py.
+#
+# The dictionaries returned by BakespaceClient can be turned into these with
+# from_dict, and turned back into request bodies with to_dict.
+
+import threading
+from itertools import islice
+from typing import List, NamedTuple, Optional, Tuple
+
+
+class ChatMessage(NamedTuple):
+    role: str
+    content: str
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["role"], data["content"])
+
+    def to_dict(self):
+        return {"role": self.role, "content": self.content}
+
+
+class Recipe(NamedTuple):
+    name: str
+    preptime: int
+    cooktime: int
+    totaltime: int
+    servings: int
+    directions: Tuple[str, ...]
+    ingredients: Tuple[str, ...]
+    recipe_text: str
+    desc: Optional[str] = None
+    calories: Optional[int] = None
+    recipe_id: Optional[str] = None
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(
+            name=data["name"],
+            preptime=data["preptime"],
+            cooktime=data["cooktime"],
+            totaltime=data["totaltime"],
+            servings=data["servings"],
+            directions=tuple(data["directions"]),
+            ingredients=tuple(data["ingredients"]),
+            recipe_text=data["recipe_text"],
+            desc=data.get("desc"),
+            calories=data.get("calories"),
+            recipe_id=data.get("recipe_id"),
+        )
+
+    def to_dict(self):
+        data = self._asdict()
+        data["directions"] = list(self.directions)
+        data["ingredients"] = list(self.ingredients)
+        return data
+
+
+class Pairing(NamedTuple):
+    pairing_text: str
+    pairing_reason: str
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["pairing_text"], data["pairing_reason"])
+
+    def to_dict(self):
+        return {"pairing_text": self.pairing_text, "pairing_reason": self.pairing_reason}
+
+
+def as_message(message):
+    # Accepts a ChatMessage, a (role, content) tuple, or a {"role", "content"} dict
+    if type(message) is ChatMessage:
+        return message
+    if isinstance(message, tuple):
+        return ChatMessage(*message)
+    return ChatMessage.from_dict(message)
+
+
+class ChatHistory:
+    """Append-only, immutable chat history.
+
+    ``append`` returns a new history instead of changing this one, but the new
+    history shares its storage with the old one, so appending does not copy the
+    messages already in the history.  Each history only ever sees the first
+    ``len(history)`` messages of the shared storage; if an older history is
+    appended to after a newer one has been made from it, the older one is copied
+    first so the newer history is never changed.  Appends are safe to make from
+    several threads: each storage list has its own lock, shared by the histories
+    that view it, so histories of unrelated sessions never contend.
+    """
+
+    __slots__ = ("_messages", "_length", "_lock")
+
+    def __init__(self, messages=()):
+        self._messages = [as_message(message) for message in messages]
+        self._length = len(self._messages)
+        self._lock = threading.Lock()
+
+    @classmethod
+    def _view(cls, messages, length, lock):
+        history = cls.__new__(cls)
+        history._messages = messages
+        history._length = length
+        history._lock = lock
+        return history
+
+    def append(self, message):
+        message = as_message(message)
+        # The check and the append must not be split by another thread appending to
+        # the same storage, or both would think they are at its end
+        with self._lock:
+            if self._length == len(self._messages):
+                self._messages.append(message)
+                return self._view(self._messages, self._length + 1, self._lock)
+        # Another history already appended to the shared storage past this one
+        return self._view(self._messages[:self._length] + [message], self._length + 1, threading.Lock())
+
+    def extend(self, messages):
+        history = self
+        for message in messages:
+            history = history.append(message)
+        return history
+
+    def __len__(self):
+        return self._length
+
+    def __iter__(self):
+        return islice(self._messages, self._length)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._messages[:self._length][index]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("chat history index out of range")
+        return self._messages[index]
+
+    def __eq__(self, other):
+        return isinstance(other, ChatHistory) and list(self) == list(other)
+
+    def __repr__(self):
+        return f"ChatHistory({list(self)!r})"
+
+    def __reduce__(self):
+        # Only pickle the messages this history can see, flattened into one list of
+        # strings.  Pickling a list of strings is much cheaper than pickling each
+        # message as its own object, and the repeated role strings are memoized.
+        flat = []
+        for message in self:
+            flat += message
+        return (_unpickle_history, (flat,))
+
+    def to_dicts(self) -> List[dict]:
+        # The shape expected for chat_messages by /get_chef_response
+        return [message.to_dict() for message in self]
+
+
+def _unpickle_history(flat):
+    pairs = iter(flat)
+    messages = [tuple.__new__(ChatMessage, message) for message in zip(pairs, pairs)]
+    return ChatHistory._view(messages, len(messages), threading.Lock())
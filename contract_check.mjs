@@ -0,0 +1,40 @@
+// Runs calls against the generated JavaScript client for contract_check.py.  Reads
+// the base URL and the trace id to propagate as arguments, and a JSON list of
+// {"name", "method", "args"} calls on stdin.  Prints the result (or error) of every
+// call and the trace id the service returned for it as JSON, so contract_check.py
+// can validate them against the spec.
+//
+// fetch is replaced with one that behaves like a browser's: it throws "Illegal
+// invocation" when called as a method of another object, and rejects keepalive
+// requests with bodies over 64 KiB.
+
+import { readFileSync } from 'node:fs';
+
+const KEEPALIVE_BODY_LIMIT = 64 * 1024;
+
+function browserFetch(url, init = {}) {
+  if (this !== undefined && this !== globalThis) {
+    throw new TypeError("Failed to execute 'fetch' on 'Window': Illegal invocation");
+  }
+  if (init.keepalive && typeof init.body === 'string' && new Blob([init.body]).size > KEEPALIVE_BODY_LIMIT) {
+    throw new TypeError('Failed to fetch: keepalive request body is larger than 64 KiB');
+  }
+  return fetch(url, init);
+}
+
+// The client is an ES module in a plain .js file, so it is imported from its source
+const source = readFileSync(new URL('./clients/bakespace_client.js', import.meta.url), 'utf8');
+const { BakespaceClient } = await import('data:text/javascript,' + encodeURIComponent(source));
+
+const client = new BakespaceClient({ baseUrl: process.argv[2], traceId: process.argv[3], fetchImpl: browserFetch });
+const calls = JSON.parse(readFileSync(0, 'utf8'));
+const results = {};
+for (const { name, method, args } of calls) {
+  if (args.files) args.files = args.files.map((content) => new Blob([content]));
+  try {
+    results[name] = { result: await client[method](args), traceId: client.lastTraceId };
+  } catch (error) {
+    results[name] = { error: String(error) };
+  }
+}
+process.stdout.write(JSON.stringify(results));
@@ -0,0 +1,147 @@
+# Contract check for the generated Python and JavaScript clients.  Calls every
+# operation in the spec with example arguments and validates each response against
+# its schema.  By default it runs against the stub server, so the clients can be
+# checked offline; pass --base-url to run the same checks against a real backend.
+# The JavaScript client is run through contract_check.mjs and is skipped when node
+# is not installed.
+#
+# Usage: python contract_check.py [--base-url http://localhost:8000]
+
+import argparse
+import json
+import os
+import shutil
+import subprocess
+import sys
+import threading
+
+from api_spec import OPERATIONS, example, operation_id, validate
+from generate_api import camel_case
+from stub_server import load_spec, make_server
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(ROOT, "clients"))
+
+# Larger than the 64 KiB browsers allow for keepalive request bodies
+LARGE_TEXT = "x" * (100 * 1024)
+
+from bakespace_client import BakespaceClient  # noqa: E402
+
+
+def example_arguments(operation, spec):
+    arguments = {}
+    for name, schema in operation.get("body", {}).items():
+        arguments[name] = example(schema, spec, name)
+    for name, schema in operation.get("query", {}).items():
+        arguments[name] = example(schema, spec, name)
+    if "files" in operation:
+        arguments["files"] = [("example.txt", b"example")]
+    return arguments
+
+
+def run_checks(client, spec):
+    failures = 0
+    for key, operation in OPERATIONS.items():
+        try:
+            result = getattr(client, operation_id(key))(**example_arguments(operation, spec))
+            errors = validate(result, operation["response"], spec, "response")
+        except Exception as e:
+            errors = [str(e)]
+        failures += bool(errors)
+        print(f"{'FAIL' if errors else 'ok':<6}{key}")
+        for error in errors:
+            print(f"        {error}")
+    return failures
+
+
+def run_rejection_checks(client, spec):
+    # Requests that leave out every field of an any_of group, or that pass a history
+    # cursor that is not a non-negative integer, must be rejected
+    failures = 0
+    for key, operation in OPERATIONS.items():
+        method, path = key.split(" ", 1)
+        requests = []
+        for group in operation.get("any_of", []):
+            body = {name: value for name, value in example_arguments(operation, spec).items() if name not in group}
+            requests.append((f"{key} without {' or '.join(group)}", {"json": body}))
+        if operation.get("history"):
+            requests += [(f"{key}?since={since}", {"params": {"since": since}}) for since in ("abc", "-1", "1.5")]
+        for name, arguments in requests:
+            response = client.session.request(method, client.base_url + path, timeout=client.timeout, **arguments)
+            failed = response.status_code != 422
+            failures += failed
+            print(f"{'FAIL' if failed else 'ok':<6}{name} is rejected (status {response.status_code})")
+    return failures
+
+
+def run_trace_checks(base_url):
+    # The trace id passed to the client must be sent with every request and come back
+    client = BakespaceClient(base_url, trace_id="contract-check-trace")
+    try:
+        client.view_chat_history()
+        failed = client.last_trace_id != "contract-check-trace"
+    finally:
+        client.close()
+    print(f"{'FAIL' if failed else 'ok':<6}X-Trace-Id is propagated (returned {client.last_trace_id!r})")
+    return int(failed)
+
+
+def run_js_checks(base_url, spec):
+    node = shutil.which("node")
+    if node is None:
+        print("skip  JavaScript client (node is not installed)")
+        return 0
+    calls = []
+    for key, operation in OPERATIONS.items():
+        arguments = example_arguments(operation, spec)
+        if "files" in arguments:
+            arguments["files"] = [content.decode() for _, content in arguments["files"]]
+        calls.append({"name": key, "method": camel_case(operation_id(key)), "args": arguments})
+    calls.append({"name": "POST /format-recipe with a 100 KiB body", "method": "formatRecipe", "args": {"raw_text": LARGE_TEXT}})
+    output = subprocess.run(
+        [node, os.path.join(ROOT, "contract_check.mjs"), base_url, "contract-check-trace"],
+        input=json.dumps(calls), capture_output=True, text=True, check=True,
+    ).stdout
+    failures = 0
+    for name, outcome in json.loads(output).items():
+        key = name.split(" with ")[0]
+        if "error" in outcome:
+            errors = [outcome["error"]]
+        else:
+            errors = validate(outcome["result"], OPERATIONS[key]["response"], spec, "response")
+            if outcome["traceId"] != "contract-check-trace":
+                errors.append(f"X-Trace-Id was not propagated (returned {outcome['traceId']!r})")
+        failures += bool(errors)
+        print(f"{'FAIL' if errors else 'ok':<6}{name} (JavaScript)")
+        for error in errors:
+            print(f"        {error}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Contract check the generated client against the API spec")
+    parser.add_argument("--base-url", help="backend to check against instead of the local stub server")
+    args = parser.parse_args()
+
+    spec = load_spec()
+    server = None
+    base_url = args.base_url
+    if base_url is None:
+        server = make_server(port=0, spec=spec)
+        threading.Thread(target=server.serve_forever, daemon=True).start()
+        base_url = f"http://127.0.0.1:{server.server_address[1]}"
+
+    client = BakespaceClient(base_url)
+    try:
+        failures = run_checks(client, spec) + run_rejection_checks(client, spec)
+        failures += run_trace_checks(base_url) + run_js_checks(base_url, spec)
+    finally:
+        client.close()
+        if server is not None:
+            server.shutdown()
+    print("All operations match the spec" if not failures else f"{failures} checks failed")
+    sys.exit(1 if failures else 0)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1522 @@
+# Shared registry of the endpoint documentation shown on each page in pages/.
+# The registry is built once per server process with st.cache_resource, so a rerun
+# of a page (i.e. changing the selected endpoint) does not rebuild the large endpoint
+# dictionaries or re-process their code examples.
+
+import textwrap
+
+import streamlit as st
+
+CHAT_ENDPOINTS = {
+    "Streamlit Example": {
+        "language": "python",
+        "description": """
+    This is an example of the class implementation in Streamlit.  The class is initialized in the session state and then the user can
+    initialize the chat with some context, ask a question, and receive a response.  The chat history is maintained in state and can be
+    accessed at any time.
+    """,
+        "code_example": """
+    # TracedSession is the requests.Session from the Streamlit example on the Tracing and Metrics page
+    from tracing import TracedSession
+
+    class ChatMessage:
+        def __init__(self, role, content):  
+            self.role = role
+            self.content = content
+    class ChatService:
+        def __init__(self):
+            self.baseUrl = "http://localhost:8000"  # Replace with your FastAPI server's URL
+            # Sends an X-Trace-Id with every request, see the Tracing and Metrics page
+            self.session = TracedSession()
+            self.chat_history = []
+            self.initial_message = {}
+
+        
+        # Initialize the chat @TODO: convert the initial message and the chat history to a dictionary with the same keys to be iterated over
+        # For context to feed the model when answering questions
+        # Pass recipe_id instead of context to chat about a recipe registered with /register_recipe_context
+        def initialize_chat(self, context=None, recipe_id=None):
+            payload = {"recipe_id": recipe_id} if recipe_id else {"context": context}
+            response = self.session.post(f"{self.baseUrl}/initialize_chat", json=payload)
+            data = response.json()
+            st.session_state.initial_message = data
+            st.session_state.chat_service.chat_history.append(data)
+            return st.session_state.initial_message
+        
+        def add_user_message(self, message):
+            response = self.session.post(f"{self.baseUrl}/add_user_message", json={"message": message})
+            data = response.json()
+            # Convert the response to a Message object
+            message = ChatMessage(role = "user", content = data[0]['data']['content'])
+
+            # Append the message to the chat history
+            st.session_state.chat_service.chat_history.append({"role": message.role, "content": message.content})
+
+            # Return the chat history
+            return st.session_state.chat_service.chat_history
+
+        def add_chef_message(self, message):
+            response = self.session.post(f"{self.baseUrl}/add_chef_message", json={"message": message})
+            data = response.json()        
+            # Convert the response to a Message object
+            message = ChatMessage(role = "ai", content = data[0]['data']['content'])
+            # Append the message to the chat history
+            st.session_state.chat_service.chat_history.append({"role": message.role, "content": message.content})
+            # Return the chat history
+            return st.session_state.chat_service.chat_history
+        
+        def get_chef_response(self, question, chat_messages):
+            data = {"question": question, "chat_messages": chat_messages}
+            response = self.session.post(f"{self.baseUrl}/get_chef_response", json=data)
+            data = response.json()
+            return data
+
+
+        def clear_chat_history(self):
+            self.chat_history = []
+
+    
+    """,
+    },
+    "Client State Models": {
+        "language": "python",
+        "description": """
+    This is an example of holding the chat and recipe state in the client library's compact types from `clients/bakespace_models.py`
+    rather than plain dicts.  `ChatMessage`, `Recipe`, and `Pairing` are immutable NamedTuples with no per instance `__dict__`, and
+    `ChatHistory` is an append-only history: `append` returns a new history that shares storage with the old one, so nothing is copied
+    when a message is added and the history can be stored straight into `st.session_state`.  Appends take a lock, so histories that
+    share storage can be appended to from several session threads.  The only saving is memory: for a 100 turn chat this takes about
+    40% of the memory of the list of dicts and pickles to a slightly smaller payload, but it is slower on both timed metrics.  A pickle
+    and load of the session takes about 120-150us against about 110us for the dicts.  The 200 appends take about 400us against about
+    33us for appending the dicts to a list in place, because each append builds a `ChatMessage` and a new history and takes a lock.
+    The appends stay about 12x slower at 1000 turns, so use these types only when the memory of the session state is the constraint.
+    `python benchmarks/session_state_bench.py` compares the two.
+    """,
+        "code_example": """
+    import streamlit as st
+
+    from bakespace_client import BakespaceClient
+    from bakespace_models import ChatHistory, ChatMessage, Recipe
+
+
+    class ChatService:
+        def __init__(self):
+            self.client = BakespaceClient("http://localhost:8000")  # Replace with your FastAPI server's URL
+
+        def initialize_chat(self, recipe_id):
+            initial_message = ChatMessage.from_dict(self.client.initialize_chat(recipe_id=recipe_id))
+            st.session_state.chat_history = ChatHistory([initial_message])
+            return initial_message
+
+        def get_chef_response(self, question):
+            history = st.session_state.chat_history
+            answer = self.client.get_chef_response(question, history.to_dicts())
+            # append returns a new history without copying the existing messages
+            st.session_state.chat_history = history.append(ChatMessage("user", question)).append(ChatMessage("ai", answer))
+            return answer
+
+
+    if "chat_service" not in st.session_state:
+        st.session_state.chat_service = ChatService()
+        st.session_state.recipe = Recipe.from_dict(BakespaceClient().generate_recipe("vegetarian pizza with extra cheese"))
+        st.session_state.chat_service.initialize_chat(st.session_state.recipe.recipe_id)
+
+    for message in st.session_state.chat_history:
+        st.markdown(f"**{message.role}:** {message.content}")
+    """,
+    },
+    "Redis Storage Adapter": {
+        "language": "python",
+        "description": """
+    This is an example of the storage adapter that the chat and recipe services use to hold their state in Redis.  Rather than
+    treating each message append, recipe save, and history save as its own Redis command (and its own network round trip), every
+    write made while handling a single request is queued on one pipeline and sent with a single `EXECUTE` when the request finishes.
+    Chat histories are capped lists, so each append is paired with an `LTRIM` in the same pipeline to keep only the most recent
+    `max_history` messages, and with an `INCR` of the history's sequence counter.  The counter is never trimmed, so the n-th entry
+    ever appended has sequence number n even after older entries are dropped, and `read_history` returns the entries after a given
+    sequence number -- this is the `since` cursor of the history endpoints (see "Conditional History Reads").  It only reads the new
+    entries with an `LRANGE` from the end of the list, under a `WATCH` of the counter and the list so the two stay consistent.  The
+    recipe history is capped the same way, and the saved recipes it points to are written with a `recipe_ttl` expiry in the same
+    pipeline, so recipes that have fallen off the history do not stay in Redis forever.
+
+    Reads of the history are lazy: `iter_history` pulls the list down in pages with `LRANGE` only as the caller consumes it, so
+    rendering the last few messages never loads the whole list.  The pages are absolute offsets into the list, so if another request
+    appends and trims between two pages the iteration can skip or repeat messages.  When a consistent view matters, i.e. building the
+    model's context, use `recent_messages`, which reads the tail in a single `LRANGE`.
+
+    The Redis client is pluggable.  `InMemoryBackend` implements the handful of commands the adapter needs, which lets us
+    benchmark ops/sec of the adapter itself (see the bottom of the example) without standing up a real Redis server.
+    """,
+        "code_example": """
+    import json
+    import time
+    from collections import defaultdict
+    from contextlib import contextmanager
+
+    import redis
+
+
+    class InMemoryBackend:
+        # Minimal stand-in for a redis.Redis client.  Only the commands used by the
+        # storage adapter are implemented.
+        def __init__(self):
+            self.lists = defaultdict(list)
+            self.values = {}
+            self.hashes = {}
+            self.expiry = {}
+
+        def rpush(self, key, *values):
+            self.lists[key].extend(values)
+            return len(self.lists[key])
+
+        def ltrim(self, key, start, end):
+            items = self.lists[key]
+            end = len(items) if end == -1 else end + 1
+            self.lists[key] = items[start:end]
+            return True
+
+        def lrange(self, key, start, end):
+            items = self.lists.get(key, [])
+            end = len(items) if end == -1 else end + 1
+            return items[start:end]
+
+        def llen(self, key):
+            return len(self.lists.get(key, []))
+
+        def _expire_if_due(self, key):
+            if key in self.expiry and self.expiry[key] <= time.monotonic():
+                self.delete(key)
+
+        def set(self, key, value, ex=None):
+            self.values[key] = value
+            if ex is None:
+                self.expiry.pop(key, None)
+            else:
+                self.expiry[key] = time.monotonic() + ex
+            return True
+
+        def get(self, key):
+            self._expire_if_due(key)
+            return self.values.get(key)
+
+        def mget(self, keys):
+            return [self.get(key) for key in keys]
+
+        def incr(self, key):
+            self.values[key] = int(self.values.get(key, 0)) + 1
+            return self.values[key]
+
+        def hset(self, key, mapping):
+            self.hashes.setdefault(key, {}).update({field: str(value) for field, value in mapping.items()})
+            return len(mapping)
+
+        def hgetall(self, key):
+            self._expire_if_due(key)
+            return dict(self.hashes.get(key, {}))
+
+        def expire(self, key, seconds):
+            self.expiry[key] = time.monotonic() + seconds
+            return True
+
+        def delete(self, *keys):
+            for key in keys:
+                self.lists.pop(key, None)
+                self.values.pop(key, None)
+                self.hashes.pop(key, None)
+                self.expiry.pop(key, None)
+            return len(keys)
+
+        def pipeline(self, transaction=True):
+            return InMemoryPipeline(self)
+
+
+    class InMemoryPipeline:
+        # Queues commands and applies them in order on execute(), like a redis pipeline
+        def __init__(self, backend):
+            self.backend = backend
+            self.commands = []
+            self.immediate = False
+
+        def __enter__(self):
+            return self
+
+        def __exit__(self, *exc_info):
+            self.commands = []
+            self.immediate = False
+
+        def watch(self, *keys):
+            # Nothing else can change the keys of the in-memory backend, so a watched
+            # transaction never fails.  Like redis, commands run immediately until multi().
+            self.immediate = True
+
+        def multi(self):
+            self.immediate = False
+
+        def __getattr__(self, name):
+            if self.immediate:
+                return getattr(self.backend, name)
+
+            def queue(*args, **kwargs):
+                self.commands.append((name, args, kwargs))
+                return self
+            return queue
+
+        def execute(self):
+            results = [getattr(self.backend, name)(*args, **kwargs) for name, args, kwargs in self.commands]
+            self.commands = []
+            return results
+
+
+    class StorageAdapter:
+        def __init__(self, session_id, client=None, max_history=50, page_size=20, recipe_ttl=30 * 24 * 60 * 60):
+            # The session id is the user's id plus an identifier for the chat session, recipe, etc.
+            self.session_id = session_id
+            self.client = client or redis.Redis(host="localhost", port=6379, decode_responses=True)
+            self.max_history = max_history
+            self.page_size = page_size
+            self.recipe_ttl = recipe_ttl
+            self._pipeline = None
+
+        def _key(self, name):
+            return f"{self.session_id}:{name}"
+
+        @contextmanager
+        def request(self):
+            # Batch every write made while handling a single request into one
+            # MULTI/EXEC round trip.  Nested calls reuse the outer pipeline.
+            if self._pipeline is not None:
+                yield self
+                return
+            self._pipeline = self.client.pipeline(transaction=True)
+            try:
+                yield self
+                self._pipeline.execute()
+            finally:
+                self._pipeline = None
+
+        def _writer(self):
+            # Outside of a request() block each write is sent on its own
+            return self._pipeline if self._pipeline is not None else self.client
+
+        def _append(self, name, value):
+            # The counter is incremented in the same MULTI/EXEC as the RPUSH and LTRIM, so
+            # it always equals the number of entries ever appended to the history
+            with self.request():
+                self._pipeline.incr(self._key(f"{name}:seq"))
+                self._pipeline.rpush(self._key(name), value)
+                # Keep only the most recent max_history entries
+                self._pipeline.ltrim(self._key(name), -self.max_history, -1)
+
+        def append_message(self, role, content):
+            self._append("chat_history", json.dumps({"role": role, "content": content}))
+
+        def save_recipe(self, name, recipe):
+            with self.request():
+                # LTRIM drops old names from recipe_history but not the recipes they point
+                # to, so each recipe expires on its own.  Deleting the recipes whose names
+                # fall off the list is not safe, since a recipe saved twice is listed twice.
+                self._pipeline.set(self._key(f"recipe:{name}"), json.dumps(recipe), ex=self.recipe_ttl)
+                self._append("recipe_history", name)
+
+        def get_recipe(self, name):
+            data = self.client.get(self._key(f"recipe:{name}"))
+            return json.loads(data) if data else None
+
+        def get_recipes(self, names):
+            # All of the recipes in one MGET instead of a GET per recipe
+            if not names:
+                return []
+            return [json.loads(data) for data in self.client.mget([self._key(f"recipe:{name}") for name in names]) if data]
+
+        def save_hash(self, name, mapping, ttl):
+            # Write a hash and its expiry together so it never outlives its TTL
+            writer = self._writer()
+            writer.hset(self._key(name), mapping=mapping)
+            writer.expire(self._key(name), ttl)
+
+        def get_hash(self, name):
+            return self.client.hgetall(self._key(name))
+
+        def touch(self, name, ttl):
+            self._writer().expire(self._key(name), ttl)
+
+        def iter_history(self, name="chat_history", start=0):
+            # Lazily page through a history list with LRANGE instead of loading it all at once.
+            # Pages are absolute offsets, so a concurrent append + LTRIM between pages can
+            # skip or repeat entries -- use recent_messages for a consistent snapshot.
+            key = self._key(name)
+            while True:
+                page = self.client.lrange(key, start, start + self.page_size - 1)
+                if not page:
+                    return
+                for item in page:
+                    yield json.loads(item) if name == "chat_history" else item
+                start += len(page)
+
+        def recent_messages(self, count):
+            # Read only the tail of the history in one LRANGE, e.g. for the context window of the model
+            if count <= 0:
+                # lrange(key, -0, -1) would return the whole list
+                return []
+            return [json.loads(item) for item in self.client.lrange(self._key("chat_history"), -count, -1)]
+
+        def read_history(self, name="chat_history", since=0):
+            # Returns the entries appended after the one with sequence number `since`, as
+            # (seq, entry) pairs, and the sequence number of the last entry, which is the
+            # `since` to pass next time.  The new entries are the last cursor - since
+            # entries of the list, so only those are read.  The counter and the list are
+            # WATCHed so that an append or clear between reading the counter and the
+            # LRANGE fails the EXEC, and the read is retried.
+            seq_key, key = self._key(f"{name}:seq"), self._key(name)
+            with self.client.pipeline(transaction=True) as pipeline:
+                while True:
+                    try:
+                        pipeline.watch(seq_key, key)
+                        cursor = int(pipeline.get(seq_key) or 0)
+                        if since > cursor:
+                            # The counter was lost (i.e. the key expired), so the cursor is from before it
+                            since = 0
+                        if since == cursor:
+                            # lrange(key, -0, -1) would return the whole list
+                            return [], cursor
+                        pipeline.multi()
+                        # A start before the head of a trimmed list is clamped to the head
+                        pipeline.lrange(key, since - cursor, -1)
+                        items, = pipeline.execute()
+                        break
+                    except redis.WatchError:
+                        continue
+            # The list ends with the entry numbered cursor
+            first = cursor - len(items) + 1
+            return [(first + i, json.loads(item) if name == "chat_history" else item) for i, item in enumerate(items)], cursor
+
+        def clear_chat_history(self):
+            # The sequence counter is kept so the cursors of pollers stay valid
+            self._writer().delete(self._key("chat_history"))
+
+
+    # Example usage inside the /get_chef_response handler -- the user question and the chef
+    # response are written in a single round trip
+    adapter = StorageAdapter("user_123:chat_1")
+    with adapter.request():
+        adapter.append_message("user", "How long should the dough rest?")
+        adapter.append_message("ai", "Let it rest for at least an hour.")
+
+
+    # Benchmark the adapter's ops/sec against the in-memory backend
+    def benchmark(turns=10000):
+        adapter = StorageAdapter("bench:chat", client=InMemoryBackend())
+        start = time.perf_counter()
+        for turn in range(turns):
+            with adapter.request():
+                adapter.append_message("user", f"question {turn}")
+                adapter.append_message("ai", f"answer {turn}")
+        elapsed = time.perf_counter() - start
+        print(f"{turns / elapsed:,.0f} requests/sec, {2 * turns / elapsed:,.0f} appends/sec")
+    """,
+    },
+    "POST /initialize_chat": {
+        "language": "javascript",
+        "description": """
+    Initialize the chat with the initial context. The context could be a recipe to reference or some other
+    information that we want to provide to the model to start the conversation.  This will return the appropriately 
+    formatted message to the frontend to display to the user as a json object with the role and content keys.
+
+    When chatting about a recipe, pass the `recipe_id` returned from `/register_recipe_context` (or `/generate_recipe`) instead of the
+    recipe text.  The chat is then seeded with the recipe's cached prompt prefix rather than rebuilding it from the full text.
+    """,
+        "code_example": """
+    fetch('http://localhost:8000/initialize_chat', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ context: 'context_string_here' })
+    })
+    .then(response => response.json())
+    .then(data => console.log(data));
+
+    // Or, for a recipe that has already been registered
+    fetch('http://localhost:8000/initialize_chat', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ recipe_id: 'recipe_id_here' })
+    })
+    .then(response => response.json())
+    .then(data => console.log(data));""",
+    },
+    "POST /add_user_message": {
+        "language": "javascript",
+        "description": """
+        
+    Add a user message to the chat. This will return the chat history to the frontend as a json object
+    that can be parsed and added to the chat history.
+    
+    """,
+        "code_example": """
+        fetch('http://localhost:8000/add_user_message', {
+        method: 'POST',
+        headers: { 'Content-Type': 'application/json' },
+        body: JSON.stringify({ message: 'user_message_here' })
+    })
+    .then(response => response.json())
+    .then(data => console.log(data));""",
+    },
+
+    "POST /add_chef_message": {
+        "language": "javascript",
+        "description": """
+    Add a chef message to the chat. This will return the chat history to the frontend as a json object
+    that can be parsed and added to the chat history.
+    """,
+        "code_example": """
+        fetch('http://localhost:8000/add_chef_message', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({ message: 'chef_message_here' })
+})
+.then(response => response.json())
+.then(data => console.log(data));
+
+    """,
+    },
+    "POST /get_chef_response": {
+        "language": "javascript",
+        "description": """
+    Get a response from the chef from a user question. This will be the primary function that we use to get a response
+    as it will automatically add the user question and chef response to the chat history automatically. It takes in
+    the user question and the chat history formatted as a dictionary or list of dictionaries with the keys "role" and "content". 
+    The data is parsed based on the ChefRequest object, which is a list of ChatMessage objects. This will return the chef response 
+    to the frontend as a string and update the chat history.
+    """,
+        "code_example": """
+        fetch('http://localhost:8000/get_chef_response', {
+    method: 'POST',
+    headers: { 'Content-Type': 'application/json' },
+    body: JSON.stringify({
+        question: 'user_question_here',
+        chat_messages: [
+            { role: 'role_here', content: 'content_here' },
+            // other messages...
+        ]
+    })
+})
+.then(response => response.json())
+.then(data => console.log(data));
+    """,
+    },
+
+    "GET /view_chat_history": {
+        "language": "javascript",
+        "description": """
+    Create a route to view the chat history. This takes in the chat service and returns the chat history as a json object.
+
+    Since the frontend polls this endpoint, it supports a few ways to avoid sending the full history every time.  Pass `since`
+    (the sequence number of the last message already read, returned in the `X-History-Cursor` response header) to only get the
+    new messages.
+    Every response has an `ETag`, and sending it back in `If-None-Match` returns an empty `304 Not Modified` if nothing has changed.
+    Responses over 500 bytes are gzip or brotli compressed when the client accepts it.  See "Conditional History Reads" for the
+    backend implementation.
+    """,
+        "code_example": """
+        let cursor = 0;
+let etag = null;
+const messages = [];
+
+async function pollChatHistory() {
+    const headers = etag ? { 'If-None-Match': etag } : {};
+    const response = await fetch(`http://localhost:8000/view_chat_history?since=${cursor}`, { method: 'GET', headers });
+    if (response.status === 304) return messages;  // nothing new
+    etag = response.headers.get('ETag');
+    cursor = Number(response.headers.get('X-History-Cursor'));
+    messages.push(...await response.json());
+    return messages;
+}
+    """,
+    },
+    "Conditional History Reads": {
+        "language": "python",
+        "description": """
+    This is an example of how the history endpoints avoid resending the full history on every poll.  Responses are compressed
+    above a size threshold by middleware, and `since` is the sequence number of the last entry the client has already read, so only
+    the entries appended after it are serialized.  Sequence numbers come from the counter that `StorageAdapter` increments with
+    every append (see "Redis Storage Adapter"), so the cursor stays valid when the capped list is trimmed, unlike an offset into the
+    list.  The ETag covers both the cursor and the returned entries, which lets repeat polls be answered with an empty 304 while an
+    append of an entry identical to the last one still changes it.  Comparing the bytes transferred over a polling session with each
+    of these turned on can be done with `python benchmarks/history_polling.py`.
+    """,
+        "code_example": """
+    import hashlib
+    import json
+
+    from fastapi import Query, Request, Response
+    from fastapi.middleware.gzip import GZipMiddleware
+
+    try:
+        from brotli_asgi import BrotliMiddleware
+    except ImportError:
+        BrotliMiddleware = None
+
+    # Brotli falls back to gzip for clients that do not accept it
+    if BrotliMiddleware is not None:
+        app.add_middleware(BrotliMiddleware, minimum_size=500, gzip_fallback=True)
+    else:
+        app.add_middleware(GZipMiddleware, minimum_size=500)
+
+
+    def history_response(request: Request, entries, cursor):
+        body = json.dumps(entries).encode("utf-8")
+        # The cursor changes with every append, even of an entry identical to the last one
+        etag = '"' + hashlib.sha256(f"{cursor}:".encode("utf-8") + body).hexdigest()[:16] + '"'
+        headers = {"ETag": etag, "X-History-Cursor": str(cursor), "Vary": "Accept-Encoding"}
+        if request.headers.get("If-None-Match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+
+    @app.get("/view_chat_history")
+    async def view_chat_history(request: Request, since: int = Query(0, ge=0)):
+        entries, cursor = chat_service.storage.read_history("chat_history", since)
+        return history_response(request, [message for _, message in entries], cursor)
+
+
+    @app.get("/view_recipe_history")
+    async def view_recipe_history(request: Request, since: int = Query(0, ge=0)):
+        entries, cursor = recipe_service.storage.read_history("recipe_history", since)
+        return history_response(request, recipe_service.storage.get_recipes([name for _, name in entries]), cursor)
+    """,
+    },
+    "DELETE /clear_chat_history": {
+        "language": "javascript",
+        "description": """
+    Create a route to clear the chat history.
+    """,
+        "code_example": """
+        fetch('http://localhost:8000/clear_chat_history', {
+    method: 'DELETE',
+    headers: { 'Content-Type': 'application/json' }
+})
+.then(response => response.json())
+.then(data => console.log(data));
+    """,
+    },
+}
+
+EXTRACTION_ENDPOINTS = {
+    "Streamlit Example": {
+        "language": "python",
+        "description": """
+            This is an example of how to call the extraction service from a Streamlit app. This is not an endpoint on the extraction service itself.
+        """,
+        "code_example": """
+        # This is a streamlit front end to interact with our fastapi backend endpoints
+# related to text extraction and recipe editing from various file types.
+
+# Initial imports
+import streamlit as st
+import requests
+import json
+import os
+from pydantic import BaseModel
+# TracedSession is the requests.Session from the Streamlit example on the Tracing and Metrics page
+from tracing import TracedSession
+from typing import List, Optional
+
+
+class Recipe(BaseModel):
+    #recipeid: int -- this could be generated by the database
+    name: str
+    #author: str
+    #foodimg: str -- @TODO populate the foodimg field from the image generated by the image service
+    #fullimg: str
+    desc: Optional[str]
+    preptime: int
+    cooktime: int
+    totaltime: int
+    servings: int
+    directions: List[str]
+    ingredients: List[str]
+    calories: Optional[int]
+    recipe_text: str
+    # created_on: date.today()
+
+# Create an extraction service class
+class ExtractionService:
+    def __init__ (self):
+        self.baseUrl = "http://localhost:8000"
+        # Sends an X-Trace-Id with every request, see the Tracing and Metrics page
+        self.session = TracedSession()
+        self.raw_text = ""
+        self.formatted_recipe = Recipe
+        
+    # Define a function to allow the user to upload an image file and send it to the backend
+    # for text extraction
+    def extract_image_text(self, files):
+        # Prepare the files for the request
+        prepared_files = [("images", (file.name, file.getvalue())) for file in files]
+
+        # Send the files to the backend
+        response = self.session.post(f"{self.baseUrl}/extract-text-from-images", files=prepared_files)
+        # Get the response data
+        data = response.json()
+        # Convert the returned list of strings to a single string
+        data = " ".join(data)
+        # Set the raw text
+        self.raw_text = data
+        # Return the data
+        return data
+    
+    # Define a function to extract text from a pdf file or files
+    def extract_pdf_text(self, files):
+        # Convert each file to bytes and then append to a list
+        pdf_files = [("pdfs", (file.name, file.getvalue())) for file in files]
+
+        # Create a list of files
+        response = self.session.post(f"{self.baseUrl}/extract-pdf", files=pdf_files)
+
+        # Get the response data
+        data = response.json()
+        # Convert the returned list of strings to a single string
+        data = " ".join(data)
+        # Set the raw text
+        self.raw_text = data
+        # Return the data
+        return data
+    
+    def extract_txt_text(self, files):
+        # Prepare the files for the request
+        prepared_files = [("text_files", (file.name, file.getvalue())) for file in files]
+
+        # Send the files to the backend
+        response = self.session.post(f"{self.baseUrl}/extract-text-from-txt", files=prepared_files)
+
+        # Get the response data
+        data = response.json()
+
+        # Convert the returned list of strings to a single string
+        data = " ".join(data)
+
+        # Set the raw text
+        self.raw_text = data
+
+        # Return the data
+        return data
+
+    
+    # Define a function to pass the raw text to the backend for formatting
+    def format_recipe(self, raw_text):
+        payload = {"raw_text" : raw_text}
+        # Send the raw text to the backend as a JSON body
+        response = self.session.post(f"{self.baseUrl}/format-recipe", json = payload)
+        st.write(response)
+        # Get the response data
+        if response:
+            data = response.json()
+            # Set the formatted recipe
+            self.formatted_recipe = Recipe(**data)
+            # Set the is_recipe and is_formatted_recipe flags
+            st.session_state.is_recipe = True
+            st.session_state.is_formatted_recipe = True
+            
+
+        # Return the data
+        return data
+    
+
+# Initialize the session state
+if "extraction_service" not in st.session_state:
+    st.session_state.extraction_service = ExtractionService()
+if "recipe_text" not in st.session_state:
+    st.session_state.recipe_text = ""
+if "is_recipe" not in st.session_state:
+    st.session_state.is_recipe = False
+if "is_formatted_recipe" not in st.session_state:
+    st.session_state.is_formatted_recipe = False
+    
+
+# Create a title for the app
+st.title("Text Extraction and Recipe Editing")
+
+
+
+
+uploaded_files = st.file_uploader("Choose an image file to upload", type=["png", "jpg", "jpeg", "txt", "pdf"], accept_multiple_files=True)
+
+# Perform a check to ensure that the user has uploaded a file and that if they have uploaded multiple files,
+# that they are all of the same type 
+if uploaded_files:
+   
+    # Check to make sure that all of the files are of the same type
+    file_types = []
+    for file in uploaded_files:
+        file_types.append(file.type)   
+    
+    # Check to see if the user has uploaded multiple files of different types
+    if len(set(file_types)) > 1:
+        st.write("Please upload files of the same type")
+    else:
+        # Check to see if the file type is an image
+        if file_types[0] == "image/jpeg" or file_types[0] == "image/png" or file_types[0] == "image/jpg":
+            # Create a button to upload the file
+            if st.button("Upload files"):
+                with st.spinner("Extracting text from image..."):
+                    try:
+                        st.session_state.extraction_service.raw_text = st.session_state.extraction_service.extract_image_text(uploaded_files)
+                        st.session_state.is_recipe = True
+                    except Exception as e:
+                        st.write("Error extracting text from image")
+                        st.write(e)
+
+        # Check to see if the file type is a pdf
+        elif file_types[0] == "application/pdf":
+            # Create a button to upload the file
+            if st.button("Upload files"):
+                with st.spinner("Extracting text from pdf..."):
+                    try:
+                        st.session_state.extraction_service.raw_text = st.session_state.extraction_service.extract_pdf_text(uploaded_files)
+                        st.session_state.is_recipe = True
+                    except Exception as e:
+                        st.write("Error extracting text from pdf")
+                        st.write(e)
+
+        # Check to see if the file type is a txt file
+        elif file_types[0] == "text/plain":
+            # Create a button to upload the file
+            if st.button("Upload files"):
+                with st.spinner("Extracting text from txt file..."):
+                    try:
+                        st.session_state.extraction_service.raw_text = st.session_state.extraction_service.extract_txt_text(uploaded_files)
+                        st.session_state.is_recipe = True
+                    except Exception as e:
+                        st.write("Error extracting text from txt file")
+                        st.write(e)
+        else:
+            st.write("Please upload a file of type .png, .jpg, .jpeg, .txt, or .pdf")
+
+
+# Test out the formatting endpoint using the returned raw text
+#st.write(st.session_state.extraction_service.raw_text)
+
+# Create a button to format the recipe
+if st.button("Format recipe"):
+    with st.spinner("Formatting recipe..."):
+        try:
+            st.session_state.extraction_service.formatted_recipe = st.session_state.extraction_service.format_recipe(st.session_state.extraction_service.raw_text)
+            st.session_state.is_formatted_recipe = True
+        except Exception as e:
+            st.write("Error formatting recipe")
+            st.write(e)
+
+# Write out the formatted recipe
+if st.session_state.is_formatted_recipe == True:
+    st.write("Recipe name: ", st.session_state.extraction_service.formatted_recipe['name']
+            , "Ingredients: ", st.session_state.extraction_service.formatted_recipe['ingredients']
+            , "Directions: ", st.session_state.extraction_service.formatted_recipe['directions']
+            , "Prep time: ", st.session_state.extraction_service.formatted_recipe['preptime']
+            , "Cook time: ", st.session_state.extraction_service.formatted_recipe['cooktime']
+            , "Total time: ", st.session_state.extraction_service.formatted_recipe['totaltime']
+            , "Servings: ", st.session_state.extraction_service.formatted_recipe['servings']
+            , "Calories: ", st.session_state.extraction_service.formatted_recipe['calories']
+            )
+if st.session_state.is_recipe == True and st.session_state.is_formatted_recipe == False:
+    st.write("Raw text: ", st.session_state.extraction_service.raw_text)
+    """
+    },
+    "POST /extract-pdf": {
+        "language": "javascript",
+        "description": """
+            Upload pdf files and pass them to the extraction service. Returns a list of strings containing the extracted text from each pdf.
+            Example of how to call this endpoint using JavaScript's Fetch API is not provided, as it depends heavily on the specific application and environment you're working in.
+            Please refer to the Streamlit example above for an example implementation in Python as a reference.
+        """,
+        "code_example": """
+        n/a
+        """
+    },
+    "POST /spellcheck-text": {
+        "language": "javascript",
+        "description": """
+            Takes in a string of text and returns a version of that text with spelling corrections. Mostly used internally but can be used for testing.
+        """,
+        "code_example": """
+            ```javascript
+            const textData = { text: "misspelled text" };
+            fetch('http://localhost:8000/spellcheck-text', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify(textData)
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+    "POST /extract-text-from-txt": {
+        "language": "javascript",
+        "description": """
+            Extract the text from the uploaded .txt files.
+            Example of how to call this endpoint using JavaScript's Fetch API is not provided, as it depends heavily on the specific application and environment you're working in.
+            Please refer to the Streamlit example above for an example implementation in Python as a reference.
+        """,
+        "code_example": """
+        n/a
+        """
+    },
+    "POST /extract-text-from-images": {
+        "language": "javascript",
+        "description": """
+            Upload images and pass them to the extraction service. Uses the Google Vision API to extract the text from images.
+            Example of how to call this endpoint using JavaScript's Fetch API is not provided, as it depends heavily on the specific application and environment you're working in.  Please refer to the Streamlit example above for an example implementation in Python as a reference.
+        """,
+        "code_example": """
+        n/a
+        """
+    },
+    "POST /format-recipe": {
+        "language": "javascript",
+        "description": """
+            Pass the raw text to the extraction service. This intakes a string of text that is the raw extracted text from the extraction service and returns a formatted recipe object.
+        """,
+        "code_example": """
+            ```javascript
+            const rawText = "raw recipe text";
+            fetch('http://localhost:8000/format-recipe', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ raw_text: rawText })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+}
+
+RECIPE_ENDPOINTS = {
+    "POST /generate_recipe": {
+        "language": "javascript",
+        "description": """
+            This is the core recipe generating endpoint. It takes in a string, 'specifications', which can be any preferences, restrictions, etc. concatenated into a single string. It can be in natural language as the model will be able to parse it.
+            The generated recipe is returned as a JSON object, which conforms to the 'Recipe' model, along with the `recipe_id` it was registered under
+            in the recipe context registry.
+        """,
+        "code_example": """
+            Here is an example of how to call this endpoint using JavaScript's Fetch API:
+            ```javascript
+            const specifications = "vegetarian pizza with extra cheese";
+            fetch('http://localhost:8000/generate_recipe', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ specifications })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+    "POST /register_recipe_context": {
+        "language": "javascript",
+        "description": """
+        Registers a recipe in the recipe context registry and returns its `recipe_id` along with the token count of the recipe's prompt prefix.
+        The prompt prefix (the canonical recipe text that every recipe-scoped prompt starts with) is assembled and tokenized once here, and
+        `/initialize_chat`, `/generate_pairing`, and `/generate_image_url` can then be called with the `recipe_id` instead of the full recipe
+        text.  Registering the same recipe text again returns the same `recipe_id`.  Recipes returned from `/generate_recipe` and `/format-recipe`
+        are registered automatically and include their `recipe_id` in the response.
+        """,
+        "code_example": """
+            ```javascript
+            const recipeText = "full recipe text";
+            fetch('http://localhost:8000/register_recipe_context', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ recipe_text: recipeText })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));  // { recipe_id: "...", token_count: 412 }
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+    "Recipe Context Registry": {
+        "language": "python",
+        "description": """
+        This is an example implementation of the recipe context registry on the backend.  Each entry holds the canonical prompt prefix for a
+        recipe and its token count, keyed by a recipe id derived from the recipe text.  The recipe-scoped endpoints look the prefix up by id and
+        only append their own instructions, so the recipe text is assembled and token counted once per recipe instead of once per call.
+
+        The entries are kept in Redis as hashes with a TTL, written through the same `StorageAdapter` as the chat and recipe state (see
+        "Redis Storage Adapter" on the Chat Endpoints page), so a `recipe_id` registered on one worker can be used on any other and unused
+        entries expire instead of growing without bound.  Registering a recipe again, or using it, refreshes its TTL.
+        """,
+        "code_example": """
+    import hashlib
+
+    import tiktoken
+    from fastapi import HTTPException
+
+    # The adapter from "Redis Storage Adapter" on the Chat Endpoints page
+    from storage import StorageAdapter
+
+
+    class RecipeContext:
+        def __init__(self, recipe_id, prompt_prefix, token_count):
+            self.recipe_id = recipe_id
+            self.prompt_prefix = prompt_prefix
+            self.token_count = token_count
+
+
+    # Unused recipe contexts expire from Redis after a day
+    RECIPE_CONTEXT_TTL = 24 * 60 * 60
+
+
+    class RecipeContextRegistry:
+        def __init__(self, storage=None, model="gpt-3.5-turbo", ttl=RECIPE_CONTEXT_TTL):
+            self.encoding = tiktoken.encoding_for_model(model)
+            # Recipe contexts are shared by every session, so they get their own key namespace
+            self.storage = storage or StorageAdapter("recipe_context")
+            self.ttl = ttl
+
+        def register(self, recipe_text):
+            # The recipe id is derived from the text so registering the same recipe twice is a no-op
+            recipe_id = hashlib.sha256(recipe_text.strip().encode("utf-8")).hexdigest()[:16]
+            data = self.storage.get_hash(recipe_id)
+            if data:
+                self.storage.touch(recipe_id, self.ttl)
+                return RecipeContext(recipe_id, data["prompt_prefix"], int(data["token_count"]))
+            prompt_prefix = f"The recipe we are working with is:\\n{recipe_text.strip()}\\n"
+            token_count = len(self.encoding.encode(prompt_prefix))
+            with self.storage.request():
+                self.storage.save_hash(recipe_id, {"prompt_prefix": prompt_prefix, "token_count": token_count}, self.ttl)
+            return RecipeContext(recipe_id, prompt_prefix, token_count)
+
+        def get(self, recipe_id):
+            data = self.storage.get_hash(recipe_id)
+            if not data:
+                raise HTTPException(status_code=404, detail=f"Unknown or expired recipe_id {recipe_id}")
+            self.storage.touch(recipe_id, self.ttl)
+            return RecipeContext(recipe_id, data["prompt_prefix"], int(data["token_count"]))
+
+        def build_prompt(self, recipe_id, instructions):
+            # Only the endpoint specific instructions are tokenized per call
+            context = self.get(recipe_id)
+            return context.prompt_prefix + instructions, context.token_count + len(self.encoding.encode(instructions))
+
+
+    registry = RecipeContextRegistry()
+
+    # Example usage inside the /generate_pairing handler
+    prompt, prompt_tokens = registry.build_prompt(recipe_id, f"Suggest a {pairing_type} pairing for this recipe and explain why.")
+        """
+    },
+    "GET /get_recipe_by_name": {
+        "language": "javascript",
+        "description": """
+        This endpoint allows you to retrieve the recipe by name.  It accesses the recipe via the Redis store.
+        """,
+        "code_example": """
+        """
+    },
+    "POST /save_recipe_by_name": {
+        "language": "javascript",
+        "description": """
+        Similar to the get_recipe_by_name endpoint, this endpoint allows you to save a recipe by name to the Redis store.
+        """,
+        "code_example": """
+        """
+    },
+    "DELETE /delete_recipe_by_name": {
+        "language": "javascript",
+        "description": """
+        Similar to the get_recipe_by_name endpoint, this endpoint allows you to delete a recipe by name from the Redis store.
+        """,
+        "code_example": """
+        """
+    },
+    "GET /view_recipe_history": {
+        "language": "javascript",
+        "description": """
+        Pulls up the current session's recipes for the user.  This should be stored as multiple JSON recipe objects in the Redis store.
+        The history is a capped list that is read lazily in pages rather than loaded all at once.
+
+        Like `/view_chat_history`, this supports `since` cursors (the sequence number of the last recipe read, returned in the
+        `X-History-Cursor` header), `ETag` / `If-None-Match`
+        conditional requests that return 304 when nothing has changed, and gzip or brotli compression of responses over 500 bytes.
+        Since each recipe carries its full `recipe_text`, polling with a cursor and an ETag saves far more here than on the chat history.
+        """,
+        "code_example": """
+            ```javascript
+            let cursor = 0;
+            let etag = null;
+            const recipes = [];
+
+            async function pollRecipeHistory() {
+                const headers = etag ? { 'If-None-Match': etag } : {};
+                const response = await fetch(`http://localhost:8000/view_recipe_history?since=${cursor}`, { method: 'GET', headers });
+                if (response.status === 304) return recipes;  // nothing new
+                etag = response.headers.get('ETag');
+                cursor = Number(response.headers.get('X-History-Cursor'));
+                recipes.push(...await response.json());
+                return recipes;
+            }
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+    "DELETE /clear_recipe_history": {
+        "language": "javascript",
+        "description": """
+        Clears the current session's recipe history.
+        """,
+        "code_example": """
+        """
+    },
+    "POST /save_recipe_history": {
+        "language": "javascript",
+        "description": """
+        Saves the current session's recipe history to the Redis store.  The recipe writes and the history trim are batched into a single
+        pipeline rather than sent as separate commands.
+        """,
+        "code_example": """
+        """
+    },
+    "Streamlit Example": {
+        "language": "python",
+        "description": """
+        This is an example implementation of the RecipeService and Recipe models in Streamlit for reference.
+        """,
+        "code_example": """
+    # TracedSession is the requests.Session from the Streamlit example on the Tracing and Metrics page
+    from tracing import TracedSession
+
+    class Recipe:
+        def __init__(self, name, ingredients, directions, servings, cooktime, preptime, calories, recipe_text):
+            self.name = name
+            self.ingredients = ingredients
+            self.directions = directions
+            self.servings = servings
+            self.cooktime = cooktime
+            self.preptime = preptime
+            self.calories = calories
+            self.recipe_text = recipe_text
+
+    class RecipeService:
+        def __init__(self):
+            self.baseUrl = "http://localhost:8000"
+            # Sends an X-Trace-Id with every request, see the Tracing and Metrics page
+            self.session = TracedSession()
+            self.recipe = Recipe("", [], [], 0, 0, 0, 0, "")
+
+        def get_recipe(self, specifications):
+            response = self.session.post(f"{self.baseUrl}/generate_recipe", json={"specifications": specifications})
+            data = response.json()
+            # Populate the recipe service with the recipe data
+            self.recipe.name = data["name"]
+            self.recipe.ingredients = data["ingredients"]
+            self.recipe.directions = data["directions"]
+            self.recipe.servings = data["servings"]
+            self.recipe.cooktime = data["cooktime"]
+            self.recipe.preptime = data["preptime"]
+            self.recipe.calories = data["calories"]
+            self.recipe.recipe_text = data["recipe_text"]
+
+            return data
+        """
+    }
+}
+
+PAIRING_AND_IMAGE_ENDPOINTS = {
+    "Streamlit Example": {
+        "language": "python",
+        "description": """
+            This is a Streamlit example of how to implement the endpoints.  You can use this as a reference for how to implement the endpoints in your own code.
+        """,
+        "code_example": """
+    # TracedSession is the requests.Session from the Streamlit example on the Tracing and Metrics page
+    from tracing import TracedSession
+
+    class Pairing:
+        # Pairing implementation
+        def __init__(self, pairing_text, pairing_reason):
+            self.pairing_text = pairing_text
+            self.pairing_reason = pairing_reason
+
+    class PairingService:
+        def __init__(self):
+            self.baseUrl = "http://localhost:8000"
+            # Sends an X-Trace-Id with every request, see the Tracing and Metrics page
+            self.session = TracedSession()
+            self.pairing_type = ""
+            self.recipe = ""
+            self.pairing = Pairing("", "")
+
+        # Pass the recipe_id of a registered recipe instead of the full recipe text where possible
+        def get_pairing(self, pairing_type, recipe_text=None, recipe_id=None):
+            payload = {"pairing_type": pairing_type}
+            if recipe_id:
+                payload["recipe_id"] = recipe_id
+            else:
+                payload["recipe_text"] = recipe_text
+            response = self.session.post(f"{self.baseUrl}/generate_pairing", json=payload)
+            data = response.json()
+            # Populate the pairing service with the pairing data
+            self.pairing.pairing_text = data['pairing_text']
+            self.pairing.pairing_reason = data['pairing_reason']
+            return data
+
+    # Image Generation implementation
+    class ImageService:
+        def __init__(self):
+            self.baseUrl = "http://localhost:8000"
+            # Sends an X-Trace-Id with every request, see the Tracing and Metrics page
+            self.session = TracedSession()
+            self.prompt = ""
+            self.image_url = ""
+
+        # For a recipe image pass its recipe_id and the prompt is built from the registered recipe
+        def get_image(self, prompt=None, recipe_id=None):
+            payload = {"recipe_id": recipe_id} if recipe_id else {"prompt": prompt}
+            response = self.session.post(f"{self.baseUrl}/generate_image_url", json=payload)
+            data = response.json()
+            return data
+        """,
+    },
+    "POST /generate_image_url": {
+        "language": "javascript",
+        "description": """
+            Takes in a string prompt and returns an image url. The image url is generated based on the provided prompt that is passed to the StabilityAI API.
+            For a recipe image, pass the `recipe_id` from the recipe context registry instead of a prompt and the prompt will be built from the registered recipe.
+        """,
+        "code_example": """
+            ```javascript
+            const prompt = "a scenic mountain view";
+            fetch('http://localhost:8000/generate_image_url', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ prompt })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+
+            // Or, for a registered recipe
+            fetch('http://localhost:8000/generate_image_url', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ recipe_id: recipeId })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+    "POST /generate_pairing": {
+        "language": "javascript",
+        "description": """
+            Takes in a recipe text and pairing type as input and returns a Pairing object. The Pairing object includes details about a recommended pairing based on the provided recipe and pairing type.
+            A `recipe_id` from the recipe context registry can be passed in place of `recipe_text` so the recipe prompt is not rebuilt and re-tokenized for every pairing.
+        """,
+        "code_example": """
+            ```javascript
+            const recipeId = "recipe_id_here";  // from /register_recipe_context or /generate_recipe
+            const pairingType = "wine";
+            fetch('http://localhost:8000/generate_pairing', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ recipe_id: recipeId, pairing_type: pairingType })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+
+            // Passing the full recipe text is still supported
+            const recipeText = "pasta with tomato sauce";
+            fetch('http://localhost:8000/generate_pairing', {
+                method: 'POST',
+                headers: { 'Content-Type': 'application/json' },
+                body: JSON.stringify({ recipe_text: recipeText, pairing_type: pairingType })
+            })
+            .then(response => response.json())
+            .then(data => console.log(data));
+            ```
+            Replace 'http://localhost:8000' with the actual server URL if different.
+        """
+    },
+}
+
+OBSERVABILITY_ENDPOINTS = {
+    "Tracing Middleware": {
+        "language": "python",
+        "description": """
+            This is an example implementation of the tracing on the backend.  `TraceMiddleware` starts a trace for every request, reads
+            the trace id from the `X-Trace-Id` header, and records the total request time.  Metrics are labelled with the matched route
+            template (i.e. `/get_recipe_by_name`), or `unmatched` when no route matched, so 404 scans cannot create unbounded time series.
+            Inside the handlers each stage is wrapped in `span(...)`, which records its duration on the current trace and in the
+            `bakespace_stage_latency_seconds` histogram.  Token counts returned by the LLM are recorded with `record_tokens`.  When
+            `BAKESPACE_TRACE_FILE` is set, every finished trace is appended to that file as a single JSON line by `LocalTraceExporter`.
+            The exporter hands traces to a background thread through a queue, so `dispatch` never does blocking file I/O on the event loop.
+        """,
+        "code_example": """
+    import contextvars
+    import json
+    import os
+    import queue
+    import threading
+    import time
+    import uuid
+    from contextlib import contextmanager
+
+    from prometheus_client import Counter, Histogram
+    from starlette.middleware.base import BaseHTTPMiddleware
+
+    STAGE_LATENCY = Histogram(
+        "bakespace_stage_latency_seconds",
+        "Latency of each stage of a request",
+        ["service", "endpoint", "stage"],
+        buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    )
+    REQUEST_LATENCY = Histogram(
+        "bakespace_request_latency_seconds",
+        "Total server side latency of a request",
+        ["service", "endpoint", "status"],
+        buckets=(0.01, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60),
+    )
+    TOKENS = Counter(
+        "bakespace_llm_tokens_total",
+        "Tokens sent to and received from the LLM",
+        ["service", "endpoint", "kind"],
+    )
+
+    current_trace = contextvars.ContextVar("current_trace", default=None)
+
+
+    def route_template(scope):
+        # Label metrics with the matched route template rather than the raw path, so
+        # unknown paths (i.e. 404 scans) do not each create a new time series
+        route = scope.get("route")
+        return route.path if route is not None else "unmatched"
+
+
+    class Trace:
+        def __init__(self, trace_id, service, scope):
+            self.trace_id = trace_id
+            self.service = service
+            # The router fills in the matched route after the trace is started
+            self.scope = scope
+            self.start = time.time()
+            self.spans = []
+            self.tokens = {}
+
+        @property
+        def endpoint(self):
+            return route_template(self.scope)
+
+        def to_dict(self):
+            return {
+                "trace_id": self.trace_id,
+                "service": self.service,
+                "endpoint": self.endpoint,
+                "start": self.start,
+                "spans": self.spans,
+                "tokens": self.tokens,
+            }
+
+
+    class LocalTraceExporter:
+        # Appends each finished trace to a JSON lines file so traces can be inspected offline.
+        # export() only puts the trace on a queue; a background thread does the file writes so
+        # the event loop is never blocked on disk I/O.
+        def __init__(self, path, max_queue=10000):
+            self.path = path
+            self.queue = queue.Queue(maxsize=max_queue)
+            threading.Thread(target=self._write, daemon=True).start()
+
+        def export(self, trace):
+            try:
+                self.queue.put_nowait(trace.to_dict())
+            except queue.Full:
+                # Drop traces rather than slow down requests if the writer falls behind
+                pass
+
+        def _write(self):
+            with open(self.path, "a") as f:
+                while True:
+                    f.write(json.dumps(self.queue.get()) + "\\n")
+                    if self.queue.empty():
+                        f.flush()
+
+
+    exporter = LocalTraceExporter(os.environ["BAKESPACE_TRACE_FILE"]) if os.getenv("BAKESPACE_TRACE_FILE") else None
+
+
+    @contextmanager
+    def span(stage):
+        # Time a single stage of the current request, i.e. "prompt_build", "llm", or "validation"
+        trace = current_trace.get()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration = time.perf_counter() - start
+            if trace is not None:
+                trace.spans.append({"stage": stage, "duration": duration})
+                STAGE_LATENCY.labels(trace.service, trace.endpoint, stage).observe(duration)
+
+
+    def record_tokens(prompt_tokens, completion_tokens):
+        trace = current_trace.get()
+        if trace is None:
+            return
+        trace.tokens = {"prompt": prompt_tokens, "completion": completion_tokens}
+        TOKENS.labels(trace.service, trace.endpoint, "prompt").inc(prompt_tokens)
+        TOKENS.labels(trace.service, trace.endpoint, "completion").inc(completion_tokens)
+
+
+    class TraceMiddleware(BaseHTTPMiddleware):
+        def __init__(self, app, service):
+            super().__init__(app)
+            self.service = service
+
+        async def dispatch(self, request, call_next):
+            trace_id = request.headers.get("X-Trace-Id") or uuid.uuid4().hex
+            trace = Trace(trace_id, self.service, request.scope)
+            token = current_trace.set(trace)
+            start = time.perf_counter()
+            status = 500
+            try:
+                response = await call_next(request)
+                status = response.status_code
+                response.headers["X-Trace-Id"] = trace_id
+                return response
+            finally:
+                REQUEST_LATENCY.labels(self.service, trace.endpoint, status).observe(time.perf_counter() - start)
+                current_trace.reset(token)
+                if exporter is not None:
+                    exporter.export(trace)
+
+
+    # Example usage in the recipe service
+    app.add_middleware(TraceMiddleware, service="recipe")
+
+    @app.post("/generate_recipe")
+    async def generate_recipe(request: RecipeRequest):
+        with span("prompt_build"):
+            messages = build_recipe_messages(request.specifications)
+        with span("llm"):
+            response = openai.ChatCompletion.create(model="gpt-3.5-turbo", messages=messages)
+        record_tokens(response["usage"]["prompt_tokens"], response["usage"]["completion_tokens"])
+        with span("validation"):
+            recipe = Recipe.parse_raw(response["choices"][0]["message"]["content"])
+        return recipe
+        """
+    },
+    "GET /metrics": {
+        "language": "javascript",
+        "description": """
+            Returns the stage latency and request latency histograms and the token counters in the Prometheus text exposition format.
+            Each service exposes its own `/metrics` endpoint that can be scraped by Prometheus, or fetched directly to eyeball the numbers.
+        """,
+        "code_example": """
+            ```javascript
+            fetch('http://localhost:8000/metrics', {
+                method: 'GET'
+            })
+            .then(response => response.text())
+            .then(data => console.log(data));
+
+            // bakespace_stage_latency_seconds_bucket{endpoint="/generate_recipe",le="5.0",service="recipe",stage="llm"} 12.0
+            // bakespace_llm_tokens_total{endpoint="/generate_recipe",kind="completion",service="recipe"} 5120.0
+            ```
+            On the backend the endpoint is mounted with:
+            ```python
+            from prometheus_client import make_asgi_app
+            app.mount("/metrics", make_asgi_app())
+            ```
+        """
+    },
+    "Streamlit Example": {
+        "language": "python",
+        "description": """
+            This is an example of propagating trace ids from a Streamlit client.  `TracedSession` generates a trace id for every request,
+            sends it in the `X-Trace-Id` header, and keeps the client side latency alongside the id so that it can be compared with the
+            server side spans for the same trace.  Only the latest `max_timings` requests are kept, so the session state does not grow
+            with every request.  The Streamlit examples for the chat, extraction, recipe, and pairing and image services all
+            set `self.session = TracedSession()` and send their requests with `self.session.post(...)` so every reference client propagates trace ids.
+        """,
+        "code_example": """
+    import time
+    import uuid
+    from collections import deque
+
+    import requests
+
+
+    class TracedSession(requests.Session):
+        def __init__(self, max_timings=100):
+            super().__init__()
+            # Only the most recent requests are kept, since the session lives in (and is
+            # pickled with) st.session_state on every rerun
+            self.timings = deque(maxlen=max_timings)
+
+        def request(self, method, url, **kwargs):
+            trace_id = uuid.uuid4().hex
+            headers = kwargs.pop("headers", None) or {}
+            headers.setdefault("X-Trace-Id", trace_id)
+            start = time.perf_counter()
+            response = super().request(method, url, headers=headers, **kwargs)
+            self.timings.append({
+                "trace_id": response.headers.get("X-Trace-Id", headers["X-Trace-Id"]),
+                "url": url,
+                "client_latency": time.perf_counter() - start,
+            })
+            return response
+
+
+    class RecipeService:
+        def __init__(self):
+            self.baseUrl = "http://localhost:8000"
+            self.session = TracedSession()
+
+        def get_recipe(self, specifications):
+            response = self.session.post(f"{self.baseUrl}/generate_recipe", json={"specifications": specifications})
+            return response.json()
+
+
+    if "recipe_service" not in st.session_state:
+        st.session_state.recipe_service = RecipeService()
+
+    # Show the trace ids and client latencies so they can be looked up in the exported traces
+    st.dataframe(list(st.session_state.recipe_service.session.timings))
+        """
+    },
+}
+
+# The registry is keyed by the page name as it appears in the sidebar
+PAGES = {
+    "Chat Endpoints": CHAT_ENDPOINTS,
+    "Extracton Endpoints": EXTRACTION_ENDPOINTS,
+    "Recipe Endpoints": RECIPE_ENDPOINTS,
+    "Pairing and Image Endpoints": PAIRING_AND_IMAGE_ENDPOINTS,
+    "Observability Endpoints": OBSERVABILITY_ENDPOINTS,
+}
+
+
+def selected_endpoint_key(page):
+    # Session state key of the endpoint selectbox on a page.  Setting it before switching
+    # to the page (i.e. from a search result) opens the page on that endpoint.
+    return f"selected_endpoint:{page}"
+
+
+@st.cache_resource
+def load_endpoints():
+    # Dedent the descriptions and code examples once here rather than on every rerun
+    registry = {}
+    for page, endpoints in PAGES.items():
+        registry[page] = {
+            name: {
+                "description": textwrap.dedent(endpoint["description"]).strip(),
+                "code_example": textwrap.dedent(endpoint["code_example"]).strip("\n"),
+                "language": endpoint["language"],
+            }
+            for name, endpoint in endpoints.items()
+        }
+    return registry
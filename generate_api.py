@@ -0,0 +1,279 @@
+# Generates the OpenAPI document and the typed Python and JavaScript clients from
+# the structured registry in api_spec.py.  Re-run this whenever an endpoint changes:
+#
+#     python generate_api.py
+
+import json
+import os
+
+from api_spec import OPERATIONS, SCHEMAS, build_openapi, operation_id, split_key
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+HEADER = "Generated by generate_api.py from api_spec.py -- do not edit by hand."
+HISTORY_DOC = (
+    "\n\n        Pass the sequence number of the last entry already read as `since` to only fetch the new"
+    "\n        ones; it is kept in `cursors[path]` after every call.  Repeat polls send the last ETag"
+    "\n        and reuse the cached entries when the server answers 304.\n        "
+)
+
+
+def python_type(schema):
+    if "$ref" in schema:
+        return schema["$ref"].rsplit("/", 1)[-1]
+    kind = schema.get("type")
+    if kind == "array":
+        name = f"List[{python_type(schema['items'])}]"
+    elif kind == "object":
+        name = "Dict[str, Any]"
+    else:
+        name = {"string": "str", "integer": "int"}[kind]
+    return f"Optional[{name}]" if schema.get("nullable") else name
+
+
+def js_type(schema):
+    if "$ref" in schema:
+        return schema["$ref"].rsplit("/", 1)[-1]
+    kind = schema.get("type")
+    if kind == "array":
+        name = f"{js_type(schema['items'])}[]"
+    elif kind == "object":
+        name = "Object"
+    else:
+        name = {"string": "string", "integer": "number"}[kind]
+    return f"?{name}" if schema.get("nullable") else name
+
+
+def camel_case(name):
+    first, *rest = name.split("_")
+    return first + "".join(part.title() for part in rest)
+
+
+def python_client():
+    lines = [
+        f"# {HEADER}",
+        "#",
+        "# Typed client for the BakeSpace AI API.  All requests go through one pooled",
+        "# requests.Session, and JSON bodies only include the fields that were passed.",
+        "# Every request sends an X-Trace-Id: pass trace_id to propagate the id of the",
+        "# trace the calls belong to, otherwise a new one is generated for each request.",
+        "",
+        "import uuid",
+        "from typing import Any, Dict, List, Optional, Tuple, TypedDict",
+        "",
+        "import requests",
+        "from requests.adapters import HTTPAdapter",
+        "",
+    ]
+    for name, schema in SCHEMAS.items():
+        lines += ["", f"class {name}(TypedDict):"]
+        lines += [f"    {field}: {python_type(item)}" for field, item in schema["properties"].items()]
+        lines.append("")
+    lines += [
+        "",
+        "class BakespaceClient:",
+        "    def __init__(self, base_url=\"http://localhost:8000\", pool_maxsize=10, timeout=60, session=None, trace_id=None):",
+        "        self.base_url = base_url.rstrip(\"/\")",
+        "        self.timeout = timeout",
+        "        self.trace_id = trace_id",
+        "        # Trace id the service returned for the last request, to look it up in the exported traces",
+        "        self.last_trace_id = None",
+        "        self.session = session or requests.Session()",
+        "        # Keep connections to the backend open between calls instead of reconnecting every time",
+        "        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_maxsize)",
+        "        self.session.mount(\"http://\", adapter)",
+        "        self.session.mount(\"https://\", adapter)",
+        "        # path -> (ETag, data) of the last response from each history endpoint.  Keyed by the path",
+        "        # alone so it does not grow as the cursor moves; the ETag covers the cursor, so an ETag",
+        "        # sent for a different `since` is simply answered with a 200.",
+        "        self.etag_cache = {}",
+        "        # path -> X-History-Cursor of the last response, the `since` to pass on the next poll",
+        "        self.cursors = {}",
+        "",
+        "    def close(self):",
+        "        self.session.close()",
+        "",
+        "    def _request(self, method, path, json=None, params=None, files=None, text=False, conditional=False, trace_id=None):",
+        "        # Leave out optional fields that were not passed so the request stays compact",
+        "        if json is not None:",
+        "            json = {name: value for name, value in json.items() if value is not None}",
+        "        if params is not None:",
+        "            params = {name: value for name, value in params.items() if value is not None}",
+        "        headers = {\"X-Trace-Id\": trace_id or self.trace_id or uuid.uuid4().hex}",
+        "        cached = self.etag_cache.get(path) if conditional else None",
+        "        if cached is not None:",
+        "            headers[\"If-None-Match\"] = cached[0]",
+        "        response = self.session.request(",
+        "            method, self.base_url + path, json=json, params=params, files=files, headers=headers, timeout=self.timeout",
+        "        )",
+        "        self.last_trace_id = response.headers.get(\"X-Trace-Id\", headers[\"X-Trace-Id\"])",
+        "        if conditional and \"X-History-Cursor\" in response.headers:",
+        "            self.cursors[path] = int(response.headers[\"X-History-Cursor\"])",
+        "        if cached is not None and response.status_code == 304:",
+        "            return cached[1]",
+        "        response.raise_for_status()",
+        "        data = response.text if text else response.json()",
+        "        if conditional and \"ETag\" in response.headers:",
+        "            self.etag_cache[path] = (response.headers[\"ETag\"], data)",
+        "        return data",
+    ]
+    for key, operation in OPERATIONS.items():
+        method, path = split_key(key)
+        args, call = ["self"], [f"\"{method.upper()}\"", f"\"{path}\""]
+        if "body" in operation:
+            required = operation["required"]
+            args += [f"{name}: {python_type(operation['body'][name])}" for name in required]
+            args += [
+                f"{name}: Optional[{python_type(schema)}] = None"
+                for name, schema in operation["body"].items() if name not in required
+            ]
+            call.append("json={" + ", ".join(f"\"{name}\": {name}" for name in operation["body"]) + "}")
+        if "query" in operation:
+            args += [f"{name}: {python_type(schema)}" for name, schema in operation["query"].items()]
+            call.append("params={" + ", ".join(f"\"{name}\": {name}" for name in operation["query"]) + "}")
+        if operation.get("history"):
+            args.append("since: Optional[int] = None")
+            call += ["params={\"since\": since}", "conditional=True"]
+        if "files" in operation:
+            args.append("files: List[Tuple[str, bytes]]")
+            call.append(f"files=[(\"{operation['files']}\", file) for file in files]")
+        if operation.get("text"):
+            call.append("text=True")
+        lines += [
+            "",
+            f"    def {operation_id(key)}({', '.join(args)}) -> {python_type(operation['response'])}:",
+            f"        \"\"\"{operation['summary']}.{HISTORY_DOC if operation.get('history') else ''}\"\"\"",
+            f"        return self._request({', '.join(call)})",
+        ]
+    return "\n".join(lines) + "\n"
+
+
+def js_client():
+    lines = [
+        f"// {HEADER}",
+        "//",
+        "// Typed client for the BakeSpace AI API.  Browsers and Node already reuse",
+        "// connections to the backend between fetch calls; in Node an undici Agent can be",
+        "// passed as `dispatcher` to control the size of the connection pool.  Every request",
+        "// sends an X-Trace-Id: pass traceId to propagate the id of the trace the calls",
+        "// belong to, otherwise a new one is generated for each request.",
+        "",
+    ]
+    for name, schema in SCHEMAS.items():
+        lines.append("/**")
+        lines.append(f" * @typedef {{Object}} {name}")
+        for field, item in schema["properties"].items():
+            optional = field not in schema.get("required", [])
+            lines.append(f" * @property {{{js_type(item)}}} {'[' + field + ']' if optional else field}")
+        lines += [" */", ""]
+    lines += [
+        "export class BakespaceClient {",
+        "  constructor({ baseUrl = 'http://localhost:8000', fetchImpl = fetch, dispatcher, traceId } = {}) {",
+        "    this.baseUrl = baseUrl.replace(/\\/$/, '');",
+        "    // Browsers throw \"Illegal invocation\" when fetch is called as a method of another object",
+        "    this.fetch = fetchImpl.bind(globalThis);",
+        "    this.dispatcher = dispatcher;",
+        "    this.traceId = traceId;",
+        "    // Trace id the service returned for the last request, to look it up in the exported traces",
+        "    this.lastTraceId = undefined;",
+        "    // path -> { etag, data } of the last response from each history endpoint.  Keyed by the path",
+        "    // alone so it does not grow as the cursor moves; the ETag covers the cursor, so an ETag",
+        "    // sent for a different `since` is simply answered with a 200.",
+        "    this.etagCache = new Map();",
+        "    // path -> X-History-Cursor of the last response, the `since` to pass on the next poll",
+        "    this.cursors = new Map();",
+        "  }",
+        "",
+        "  async _request(method, path, { json, query, files, text = false, conditional = false, traceId } = {}) {",
+        "    traceId = traceId || this.traceId || crypto.randomUUID().replaceAll('-', '');",
+        "    const init = { method, headers: { 'X-Trace-Id': traceId } };",
+        "    if (query) query = Object.fromEntries(Object.entries(query).filter(([, value]) => value !== undefined && value !== null));",
+        "    if (this.dispatcher) init.dispatcher = this.dispatcher;",
+        "    if (json !== undefined) {",
+        "      // Leave out optional fields that were not passed so the request stays compact",
+        "      const body = Object.fromEntries(Object.entries(json).filter(([, value]) => value !== undefined && value !== null));",
+        "      init.headers['Content-Type'] = 'application/json';",
+        "      init.body = JSON.stringify(body);",
+        "    }",
+        "    if (files !== undefined) {",
+        "      const form = new FormData();",
+        "      for (const [field, fileList] of Object.entries(files)) {",
+        "        for (const file of fileList) form.append(field, file);",
+        "      }",
+        "      init.body = form;",
+        "    }",
+        "    const search = query ? new URLSearchParams(query).toString() : '';",
+        "    const url = this.baseUrl + path + (search ? `?${search}` : '');",
+        "    const cached = conditional ? this.etagCache.get(path) : undefined;",
+        "    if (cached) init.headers['If-None-Match'] = cached.etag;",
+        "    const response = await this.fetch(url, init);",
+        "    this.lastTraceId = response.headers.get('X-Trace-Id') || traceId;",
+        "    const cursor = response.headers.get('X-History-Cursor');",
+        "    if (conditional && cursor !== null) this.cursors.set(path, Number(cursor));",
+        "    if (cached && response.status === 304) return cached.data;",
+        "    if (!response.ok) throw new Error(`${method} ${path} failed with status ${response.status}`);",
+        "    const data = await (text ? response.text() : response.json());",
+        "    const etag = response.headers.get('ETag');",
+        "    if (conditional && etag) this.etagCache.set(path, { etag, data });",
+        "    return data;",
+        "  }",
+    ]
+    for key, operation in OPERATIONS.items():
+        method, path = split_key(key)
+        params, options, docs = [], [], []
+        if "body" in operation:
+            for name, schema in operation["body"].items():
+                optional = name not in operation["required"]
+                docs.append(f"   * @param {{{js_type(schema)}}} {'[args.' + name + ']' if optional else 'args.' + name}")
+                params.append(name)
+            options.append("json: { " + ", ".join(params) + " }")
+        if "query" in operation:
+            for name, schema in operation["query"].items():
+                docs.append(f"   * @param {{{js_type(schema)}}} args.{name}")
+                params.append(name)
+            options.append("query: { " + ", ".join(operation["query"]) + " }")
+        if operation.get("history"):
+            docs.append("   * @param {number} [args.since] sequence number of the last entry already read, kept in `cursors`, to only fetch the new ones")
+            params.append("since")
+            options += ["query: { since }", "conditional: true"]
+        if "files" in operation:
+            docs.append("   * @param {Blob[]} args.files")
+            params.append("files")
+            options.append(f"files: {{ {operation['files']}: files }}")
+        if operation.get("text"):
+            options.append("text: true")
+        signature = "{ " + ", ".join(params) + " } = {}" if params else ""
+        call = f"'{method.upper()}', '{path}'" + (", { " + ", ".join(options) + " }" if options else "")
+        lines += [
+            "",
+            "  /**",
+            f"   * {operation['summary']}.",
+        ]
+        if docs:
+            lines.append("   * @param {Object} args")
+            lines += docs
+        lines += [
+            f"   * @returns {{Promise<{js_type(operation['response'])}>}}",
+            "   */",
+            f"  {camel_case(operation_id(key))}({signature}) {{",
+            f"    return this._request({call});",
+            "  }",
+        ]
+    lines.append("}")
+    return "\n".join(lines) + "\n"
+
+
+def main():
+    os.makedirs(os.path.join(ROOT, "clients"), exist_ok=True)
+    outputs = {
+        "openapi.json": json.dumps(build_openapi(), indent=2) + "\n",
+        os.path.join("clients", "bakespace_client.py"): python_client(),
+        os.path.join("clients", "bakespace_client.js"): js_client(),
+    }
+    for path, content in outputs.items():
+        with open(os.path.join(ROOT, path), "w") as f:
+            f.write(content)
+        print(f"Wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
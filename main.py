@@ -4,6 +4,9 @@
 import streamlit as st
 from streamlit_extras.switch_page_button import switch_page
 
+from endpoint_registry import selected_endpoint_key
+from search_index import load_search_index
+
 # Create buttons that link to the different pages
 st.markdown("### BakeSpace AI API Documentation")
 st.markdown("#### Select a page to view the documentation for the related endpoints for the BakeSpace AI API.\
@@ -12,6 +15,21 @@ st.markdown("#### Select a page to view the documentation for the related endpoi
 
 st.markdown("---")
 
+# Search every endpoint's name, description, and code example across all of the pages
+query = st.text_input("Search the endpoint documentation", placeholder="e.g. Redis, pairing_type, format-recipe")
+if query:
+    results = load_search_index().search(query)
+    if not results:
+        st.write("No endpoints matched your search.")
+    for i, result in enumerate(results):
+        st.markdown(f"**{result['endpoint']}** ({result['page']})  \n{result['snippet']}")
+        if st.button("Open", key=f"search_result_{i}"):
+            # Preselect the endpoint on the page before switching to it
+            st.session_state[selected_endpoint_key(result["page"])] = result["endpoint"]
+            switch_page(result["page"])
+
+    st.markdown("---")
+
 chat_button = st.button("Chat Endpoints", type='primary', use_container_width=True)
 if chat_button:
     switch_page('Chat Endpoints')
@@ -32,5 +50,9 @@ image_and_pairing_button = st.button("Image Generation and Pairing Endpoints", t
 if image_and_pairing_button:
     switch_page('Pairing and Image Endpoints')
 
+observability_button = st.button("Tracing and Metrics Endpoints", type='primary', use_container_width=True)
+if observability_button:
+    switch_page('Observability Endpoints')
+
 
 # Set up page links
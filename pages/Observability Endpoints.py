@@ -0,0 +1,29 @@
+import streamlit as st
+
+from endpoint_registry import load_endpoints, selected_endpoint_key
+
+st.title("Tracing and Metrics API Documentation")
+
+st.markdown("#### Overview:")
+st.success("""
+    Every request to the chat, recipe, extraction, pairing, and image services is traced so that we can see where the time in a slow
+    `/format-recipe` or `/generate_recipe` call is actually going.  Each request is broken up into spans for the stages it passes through:
+    `prompt_build`, `llm` (the call out to OpenAI / StabilityAI / Google Vision), and `validation` (parsing the model output into the Pydantic
+    models).  Queueing inside the server shows up as the gap between the request's total time and the sum of its spans, and network time is
+    whatever is left over when the client's measured latency is compared against the server's total.
+
+    Trace ids are generated by the clients and sent in the `X-Trace-Id` header so that the client and server sides of a request can be
+    lined up.  If no header is sent the server generates one, and it is always returned in the `X-Trace-Id` response header.  Stage latencies
+    and token counts are exposed as Prometheus histograms and counters on `/metrics`, and finished traces can be written to a local
+    JSON lines file to be inspected offline.
+
+    To view the tracing implementation, the metrics endpoint, and an example of a traced client in Streamlit, please choose an option below.
+""")
+
+endpoints = load_endpoints()["Observability Endpoints"]
+
+selected_endpoint = st.selectbox("Select an endpoint", options=list(endpoints.keys()), key=selected_endpoint_key("Observability Endpoints"))
+# Only the selected endpoint's description and code example are rendered
+endpoint = endpoints[selected_endpoint]
+st.markdown(endpoint["description"])
+st.code(endpoint["code_example"], language=endpoint["language"])
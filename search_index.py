@@ -0,0 +1,74 @@
+# Inverted index over the endpoint registry so the main page can search every
+# endpoint's name, description and code example without opening each page.
+# The index is built once per server process with st.cache_resource.
+
+import math
+import re
+from collections import defaultdict
+
+import streamlit as st
+
+from endpoint_registry import load_endpoints
+
+# Matches in the endpoint name count more than matches in the description,
+# which count more than matches in the code example
+FIELD_WEIGHTS = {
+    "name": 3.0,
+    "description": 2.0,
+    "code_example": 1.0,
+}
+
+TOKEN_PATTERN = re.compile(r"[a-z0-9]+(?:[_\-][a-z0-9]+)*")
+
+
+def tokenize(text):
+    # Compound identifiers such as "pairing_type" or "format-recipe" are indexed
+    # both as a whole and as their individual parts
+    tokens = []
+    for token in TOKEN_PATTERN.findall(text.lower()):
+        tokens.append(token)
+        parts = re.split(r"[_\-]", token)
+        if len(parts) > 1:
+            tokens.extend(parts)
+    return tokens
+
+
+class SearchIndex:
+    def __init__(self, registry):
+        # postings maps a token to {(page, endpoint): weighted term frequency}
+        self.postings = defaultdict(lambda: defaultdict(float))
+        self.documents = {}
+        for page, endpoints in registry.items():
+            for name, endpoint in endpoints.items():
+                doc_id = (page, name)
+                self.documents[doc_id] = endpoint["description"]
+                fields = {"name": name, "description": endpoint["description"], "code_example": endpoint["code_example"]}
+                for field, text in fields.items():
+                    for token in tokenize(text):
+                        self.postings[token][doc_id] += FIELD_WEIGHTS[field]
+        self.postings = {token: dict(docs) for token, docs in self.postings.items()}
+
+    def search(self, query, limit=10):
+        # Rank documents by the sum of tf-idf scores over the query terms
+        scores = defaultdict(float)
+        for token in set(tokenize(query)):
+            docs = self.postings.get(token)
+            if not docs:
+                continue
+            idf = math.log(1 + len(self.documents) / len(docs))
+            for doc_id, weight in docs.items():
+                scores[doc_id] += (1 + math.log(weight)) * idf
+        ranked = sorted(scores.items(), key=lambda item: (-item[1], item[0]))
+        return [
+            {"page": page, "endpoint": name, "score": score, "snippet": self.snippet(page, name)}
+            for (page, name), score in ranked[:limit]
+        ]
+
+    def snippet(self, page, name, length=200):
+        description = " ".join(self.documents[(page, name)].split())
+        return description if len(description) <= length else description[:length].rsplit(" ", 1)[0] + "..."
+
+
+@st.cache_resource
+def load_search_index():
+    return SearchIndex(load_endpoints())
@@ -0,0 +1,206 @@
+# Stub of the BakeSpace AI API served from openapi.json.  Every request is checked
+# against the shape declared in the spec (JSON body fields, query parameters and
+# their types, and multipart file fields) and answered with an example response
+# built from the response schema, so clients can be contract tested without the
+# real backend.
+#
+# The history endpoints behave like the backend's: they support `since=` cursors
+# over the sequence numbers of the entries (see History), answer If-None-Match with
+# 304 when the ETag still matches, and every response
+# over COMPRESSION_THRESHOLD bytes is gzip (or brotli, when installed) compressed.
+# Like the services, every response carries the request's X-Trace-Id, or a new one
+# when the request did not send it.
+#
+# Usage: python stub_server.py [--port 8000]
+
+import argparse
+import gzip
+import hashlib
+import json
+import os
+import re
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from api_spec import TRACE_HEADER, example, validate
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+
+# Responses smaller than this are sent uncompressed, where the framing overhead
+# would outweigh the savings
+COMPRESSION_THRESHOLD = 500
+
+
+def load_spec(path=os.path.join(ROOT, "openapi.json")):
+    with open(path) as f:
+        return json.load(f)
+
+
+def check_request(operation, spec, query, content_type, body):
+    # Returns the list of ways the request does not match the operation in the spec
+    errors = []
+    for parameter in operation.get("parameters", []):
+        if parameter["in"] != "query":
+            continue
+        name = parameter["name"]
+        if name not in query:
+            if parameter["required"]:
+                errors.append(f"missing query parameter '{name}'")
+            continue
+        value = query[name][0]
+        if parameter["schema"].get("type") == "integer":
+            if not re.fullmatch(r"-?[0-9]+", value):
+                errors.append(f"query.{name}: expected an integer")
+                continue
+            value = int(value)
+        errors.extend(validate(value, parameter["schema"], spec, f"query.{name}"))
+    content = operation.get("requestBody", {}).get("content", {})
+    if "application/json" in content:
+        if not content_type.startswith("application/json"):
+            return errors + ["expected a JSON request body"]
+        try:
+            payload = json.loads(body or b"null")
+        except ValueError:
+            return errors + ["request body is not valid JSON"]
+        errors.extend(validate(payload, content["application/json"]["schema"], spec, "body"))
+    elif "multipart/form-data" in content:
+        if not content_type.startswith("multipart/form-data"):
+            return errors + ["expected a multipart/form-data request body"]
+        for field in content["multipart/form-data"]["schema"]["required"]:
+            if f'name="{field}"'.encode() not in body:
+                errors.append(f"missing file field '{field}'")
+    return errors
+
+
+def compress(data, accept_encoding):
+    # Returns the body and its Content-Encoding, preferring brotli over gzip
+    if len(data) < COMPRESSION_THRESHOLD:
+        return data, None
+    encodings = {encoding.split(";")[0].strip() for encoding in accept_encoding.split(",")}
+    if brotli is not None and "br" in encodings:
+        return brotli.compress(data), "br"
+    if "gzip" in encodings:
+        return gzip.compress(data, mtime=0), "gzip"
+    return data, None
+
+
+def make_etag(cursor, data):
+    # The cursor changes with every append, even of an entry identical to the last one
+    return '"' + hashlib.sha256(f"{cursor}:".encode("utf-8") + data).hexdigest()[:16] + '"'
+
+
+class History:
+    # A history list like the backend's StorageAdapter keeps in Redis: every appended
+    # entry gets the next value of a counter that is never reset, so `since=` cursors
+    # stay valid when old entries are trimmed (max_length) or the history is cleared.
+    def __init__(self, entries=(), max_length=None):
+        self.seq = 0
+        self.entries = []
+        self.max_length = max_length
+        self.lock = threading.Lock()
+        self.extend(entries)
+
+    def append(self, entry):
+        with self.lock:
+            self.seq += 1
+            self.entries.append(entry)
+            if self.max_length is not None:
+                del self.entries[:-self.max_length]
+
+    def extend(self, entries):
+        for entry in entries:
+            self.append(entry)
+
+    def clear(self):
+        with self.lock:
+            self.entries = []
+
+    def read(self, since=0):
+        # Returns the entries after the one with sequence number `since`, and the
+        # sequence number of the last entry
+        with self.lock:
+            first = self.seq - len(self.entries) + 1
+            return self.entries[max(since - first + 1, 0):], self.seq
+
+
+class StubHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 so that pooled clients can keep their connections open
+    protocol_version = "HTTP/1.1"
+    spec = None
+    # path -> History served by that history endpoint.  Endpoints that are not in
+    # here answer with an example built from the response schema.
+    histories = {}
+
+    def handle_request(self):
+        url = urlsplit(self.path)
+        operation = self.spec["paths"].get(url.path, {}).get(self.command.lower())
+        if operation is None:
+            return self.send(404, {"detail": f"{self.command} {url.path} is not in the spec"})
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        errors = check_request(operation, self.spec, parse_qs(url.query), self.headers.get("Content-Type", ""), body)
+        if errors:
+            return self.send(422, {"detail": errors})
+        media_type, content = next(iter(operation["responses"]["200"]["content"].items()))
+        if "304" in operation["responses"]:
+            return self.send_history(url.path, parse_qs(url.query), content["schema"])
+        self.send(200, example(content["schema"], self.spec), media_type)
+
+    do_GET = do_POST = do_DELETE = handle_request
+
+    def send_history(self, path, query, schema):
+        history = self.histories.get(path)
+        if history is None:
+            history = History(example(schema, self.spec))
+        entries, cursor = history.read(int(query.get("since", ["0"])[0]))
+        etag = make_etag(cursor, json.dumps(entries).encode("utf-8"))
+        headers = {"ETag": etag, "X-History-Cursor": str(cursor)}
+        if self.headers.get("If-None-Match") == etag:
+            return self.send(304, None, headers=headers)
+        self.send(200, entries, headers=headers)
+
+    def send(self, status, payload, media_type="application/json", headers=None):
+        if status == 304:
+            data, encoding = b"", None
+        else:
+            data = (payload if media_type == "text/plain" else json.dumps(payload)).encode("utf-8")
+            data, encoding = compress(data, self.headers.get("Accept-Encoding", ""))
+        self.send_response(status)
+        self.send_header("Content-Type", media_type)
+        self.send_header("Vary", "Accept-Encoding")
+        self.send_header(TRACE_HEADER, self.headers.get(TRACE_HEADER) or uuid.uuid4().hex)
+        if encoding is not None:
+            self.send_header("Content-Encoding", encoding)
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, format, *args):
+        pass
+
+
+def make_server(host="127.0.0.1", port=8000, spec=None, histories=None):
+    handler = type("Handler", (StubHandler,), {"spec": spec or load_spec(), "histories": {} if histories is None else histories})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Serve a stub of the BakeSpace AI API from openapi.json")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8000)
+    args = parser.parse_args()
+    server = make_server(args.host, args.port)
+    print(f"Serving the BakeSpace AI API stub on http://{args.host}:{args.port}")
+    server.serve_forever()
+
+
+if __name__ == "__main__":
+    main()